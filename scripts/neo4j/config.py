@@ -2,36 +2,125 @@
 Configuration management for Neo4j loader
 """
 
+import copy
 import json
 import logging
 import os
-from configparser import ConfigParser
 from datetime import datetime
-from typing import Dict
-from dateutil.parser import parse
+from typing import Dict, Tuple
+
+# orjson is an optional accelerator (~3-5x faster parsing); the stdlib
+# json module is the fallback and the API below is identical either way
+try:
+    import orjson as _fast_json
+except ImportError:
+    _fast_json = None
 
 logger = logging.getLogger(__name__)
 
+# Section banner built once for the process lifetime
+_BANNER = "=" * 60
+
+# Cache of parsed config files keyed by (absolute path, mtime in ns).
+# Repeated LoaderConfig construction (tests, per-simulation orchestration)
+# becomes a dict lookup instead of re-reading and re-parsing the files.
+_CONF_CACHE: Dict[Tuple[str, int], Dict] = {}
+
+
+def _cached_parse(path: str, parse_fn) -> Dict:
+    """
+    Parse a config file through the module-level cache
+
+    Args:
+        path: Path to the config file
+        parse_fn: Callable taking the path and returning a parsed dict
+
+    Returns:
+        Deep copy of the cached parse result (safe to mutate)
+    """
+    key = (os.path.abspath(path), os.stat(path).st_mtime_ns)
+    if key not in _CONF_CACHE:
+        _CONF_CACHE[key] = parse_fn(path)
+    return copy.deepcopy(_CONF_CACHE[key])
+
+
+def _to_bool(value) -> bool:
+    """
+    Coerce a properties-file value to a boolean
+
+    Args:
+        value: Raw value ('true'/'false' string, bool, etc.)
+
+    Returns:
+        True only for a (case-insensitive) 'true' string or True
+    """
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() == 'true'
+
 
 class LoaderConfig:
     """
     Manages configuration for AMLSim → Neo4j data loading
+
+    All raw values are parsed and coerced to the typed fields below once,
+    in __init__; downstream code only ever reads typed attributes.
     """
 
+    # Slots drop the per-instance __dict__ and make attribute access a
+    # fixed-offset lookup, which matters for loaders reading config
+    # attributes inside their batch loops
+    __slots__ = ('amlsim_conf', 'neo4j_props', 'sim_name', 'base_date_str',
+                 'base_date', 'output_dir', '_csv_paths', 'neo4j_uri',
+                 'neo4j_user', 'neo4j_password', 'neo4j_database',
+                 'batch_size', 'primary_bank', 'default_currency',
+                 'node_parallelism', 'concurrent_batches', 'max_pool_size', 'fetch_size',
+                 'create_constraints', 'create_indexes', 'bulk_mode', 'neo4j_admin_path')
+
+    # Typed schema of the resolved configuration
+    amlsim_conf: Dict
+    neo4j_props: Dict
+    sim_name: str
+    base_date_str: str
+    base_date: datetime
+    output_dir: str
+    neo4j_uri: str
+    neo4j_user: str
+    neo4j_password: str
+    neo4j_database: str
+    batch_size: int
+    primary_bank: str
+    default_currency: str
+    node_parallelism: int
+    concurrent_batches: int
+    max_pool_size: int
+    fetch_size: int
+    create_constraints: bool
+    create_indexes: bool
+    bulk_mode: bool
+    neo4j_admin_path: str
+
     def __init__(self, conf_json_path: str, neo4j_props_path: str = "neo4j.properties",
-                 batch_size: int = None, primary_bank: str = None):
+                 batch_size: int = None, primary_bank: str = None, bulk_mode: bool = None):
         """
         Initialize configuration
 
         Args:
-            conf_json_path: Path to AMLSim conf.json
-            neo4j_props_path: Path to neo4j.properties file
+            conf_json_path: Path to AMLSim conf.json, or an already-open
+                file object (tests pass io.StringIO to skip the disk)
+            neo4j_props_path: Path to neo4j.properties file, or an
+                already-open file object
             batch_size: Override batch size (optional)
             primary_bank: Override primary bank identifier (optional)
+            bulk_mode: Override offline bulk-import mode (optional)
         """
-        # Load AMLSim configuration
-        with open(conf_json_path, 'r') as f:
-            self.amlsim_conf = json.load(f)
+        # Load AMLSim configuration (cached across constructions). File
+        # objects are parsed directly - the cache keys on path + mtime,
+        # which only a real file has
+        if hasattr(conf_json_path, 'read'):
+            self.amlsim_conf = json.load(conf_json_path)
+        else:
+            self.amlsim_conf = _cached_parse(conf_json_path, self._parse_conf_json)
 
         # Load Neo4j properties
         self.neo4j_props = self._load_neo4j_properties(neo4j_props_path)
@@ -43,11 +132,24 @@ class LoaderConfig:
         # Simulation settings
         self.sim_name = general_conf.get("simulation_name", "sample")
         self.base_date_str = general_conf.get('base_date', '2017-01-01')
-        self.base_date = parse(self.base_date_str)
+        try:
+            # Fast path: base_date is normally ISO 8601 ('2017-01-01')
+            self.base_date = datetime.fromisoformat(self.base_date_str)
+        except ValueError:
+            # Fall back to dateutil's full grammar for non-ISO inputs
+            from dateutil.parser import parse
+            self.base_date = parse(self.base_date_str)
 
         # Output directory
         self.output_dir = os.path.join(output_conf.get('directory', 'outputs'), self.sim_name)
 
+        # Precompute CSV paths once; loaders resolve them per batch
+        self._csv_paths = {
+            key: os.path.join(self.output_dir, filename)
+            for key, filename in output_conf.items()
+            if isinstance(filename, str)
+        }
+
         # Neo4j connection settings
         self.neo4j_uri = self.neo4j_props.get('neo4j.uri', 'bolt://localhost:7687')
         self.neo4j_user = self.neo4j_props.get('neo4j.user', 'neo4j')
@@ -55,25 +157,94 @@ class LoaderConfig:
         self.neo4j_database = self.neo4j_props.get('neo4j.database', 'neo4j')
 
         # Loading settings
-        self.batch_size = batch_size or int(self.neo4j_props.get('neo4j.batch_size', 10000))
+        #
+        # Larger batches amortize transaction commit cost, the expensive
+        # step of bulk UNWIND writes, at the price of server heap held per
+        # batch. 20k rows is a good default for typical Neo4j heap sizes;
+        # lower neo4j.batch_size if the server runs out of memory.
+        try:
+            self.batch_size = batch_size or int(self.neo4j_props.get('neo4j.batch_size', 20000))
+        except (TypeError, ValueError):
+            raise ValueError(f"neo4j.batch_size must be an integer, "
+                             f"got {self.neo4j_props.get('neo4j.batch_size')!r}")
+        if self.batch_size > 100000:
+            logger.warning("Batch size %s exceeds 100,000; clamping to avoid server heap pressure", f"{self.batch_size:,}")
+            self.batch_size = 100000
+        elif self.batch_size < 1000:
+            logger.warning("Batch size %s is below 1,000; throughput will suffer from per-batch commit overhead", f"{self.batch_size:,}")
         self.primary_bank = primary_bank or self.neo4j_props.get('neo4j.primary_bank', 'bank')
         self.default_currency = self.neo4j_props.get('neo4j.default_currency', 'USD')
 
+        # Number of worker threads for independent node-label loads
+        # (relationship loads always run sequentially)
+        default_parallelism = min(4, os.cpu_count() or 1)
+        try:
+            self.node_parallelism = int(self.neo4j_props.get('neo4j.node_parallelism', default_parallelism))
+        except (TypeError, ValueError):
+            raise ValueError(f"neo4j.node_parallelism must be an integer, "
+                             f"got {self.neo4j_props.get('neo4j.node_parallelism')!r}")
+
+        # Number of UNWIND batches kept in flight concurrently per load
+        # (each in-flight batch runs on its own session)
+        try:
+            self.concurrent_batches = int(self.neo4j_props.get('neo4j.concurrent_batches', 8))
+        except (TypeError, ValueError):
+            raise ValueError(f"neo4j.concurrent_batches must be an integer, "
+                             f"got {self.neo4j_props.get('neo4j.concurrent_batches')!r}")
+
+        # Driver tuning: pool sized for parallel workers with headroom, and
+        # reads streamed in batches matching the writer's cadence
+        default_pool_size = max(16, 2 * max(self.node_parallelism, self.concurrent_batches))
+        try:
+            self.max_pool_size = int(self.neo4j_props.get('neo4j.max_pool_size', default_pool_size))
+            self.fetch_size = int(self.neo4j_props.get('neo4j.fetch_size', self.batch_size))
+        except (TypeError, ValueError):
+            raise ValueError("neo4j.max_pool_size and neo4j.fetch_size must be integers")
+
         # Schema settings
-        self.create_constraints = self.neo4j_props.get('neo4j.create_constraints', 'true').lower() == 'true'
-        self.create_indexes = self.neo4j_props.get('neo4j.create_indexes', 'true').lower() == 'true'
+        self.create_constraints = _to_bool(self.neo4j_props.get('neo4j.create_constraints', 'true'))
+        self.create_indexes = _to_bool(self.neo4j_props.get('neo4j.create_indexes', 'true'))
+
+        # Bulk-import mode: stage admin-import CSVs and run
+        # `neo4j-admin database import full` instead of transactional
+        # UNWIND loads. Only valid for a fresh (empty) database, but 1-2
+        # orders of magnitude faster because it writes store files
+        # directly and bypasses the transaction log.
+        if bulk_mode is not None:
+            self.bulk_mode = bulk_mode
+        else:
+            self.bulk_mode = _to_bool(self.neo4j_props.get('neo4j.bulk_mode', 'false'))
+        self.neo4j_admin_path = self.neo4j_props.get('neo4j.admin_path', 'neo4j-admin')
 
-        logger.info(f"Configuration loaded:")
-        logger.info(f"  Simulation: {self.sim_name}")
-        logger.info(f"  Output directory: {self.output_dir}")
-        logger.info(f"  Neo4j URI: {self.neo4j_uri}")
-        logger.info(f"  Neo4j database: {self.neo4j_database}")
-        logger.info(f"  Batch size: {self.batch_size:,}")
-        logger.info(f"  Primary bank: {self.primary_bank}")
+        # Full field dump lives in log_summary(); avoid double-logging here
+        logger.info("Configuration loaded from %s",
+                    getattr(conf_json_path, 'name', conf_json_path))
 
-    def _load_neo4j_properties(self, properties_file: str) -> Dict:
+    @staticmethod
+    def _parse_conf_json(conf_json_path: str) -> Dict:
         """
-        Load Neo4j connection properties from file
+        Parse AMLSim conf.json from disk
+
+        Args:
+            conf_json_path: Path to AMLSim conf.json
+
+        Returns:
+            Parsed configuration dictionary
+        """
+        if _fast_json is not None:
+            with open(conf_json_path, 'rb') as f:
+                return _fast_json.loads(f.read())
+
+        with open(conf_json_path, 'r') as f:
+            return json.load(f)
+
+    @staticmethod
+    def _parse_properties(properties_file: str) -> Dict:
+        """
+        Parse a Neo4j properties file from disk
+
+        The file is flat `key=value` pairs, so a single-pass split avoids
+        the interpolation and section machinery of ConfigParser.
 
         Args:
             properties_file: Path to properties file
@@ -81,35 +252,78 @@ class LoaderConfig:
         Returns:
             Dictionary of properties
         """
-        config = ConfigParser()
+        with open(properties_file, 'r') as f:
+            return LoaderConfig._parse_properties_lines(f)
+
+    @staticmethod
+    def _parse_properties_lines(lines) -> Dict:
+        """
+        Parse `key=value` properties from an iterable of lines
+
+        Args:
+            lines: Open file object or any iterable of lines
+
+        Returns:
+            Dictionary of properties
+        """
+        props = {}
 
-        if os.path.exists(properties_file):
-            config.read(properties_file)
-            props = {}
+        for raw_line in lines:
+            line = raw_line.strip()
 
-            # Read from all sections
-            for section in config.sections():
-                for key, value in config.items(section):
-                    props[key] = value
+            # Skip blanks, comments and section headers like [neo4j]
+            if not line or line[0] in '#;[':
+                continue
 
-            # Also check default section
-            if config.defaults():
-                props.update(dict(config.defaults()))
+            key, sep, value = line.partition('=')
+            if sep:
+                props[key.strip()] = value.strip()
 
-            logger.info(f"Loaded Neo4j properties from {properties_file}")
+        return props
+
+    @classmethod
+    def clear_cache(cls):
+        """
+        Clear the module-level parsed-file cache (mainly for tests)
+        """
+        _CONF_CACHE.clear()
+
+    def _load_neo4j_properties(self, properties_file: str) -> Dict:
+        """
+        Load Neo4j connection properties from file
+
+        Args:
+            properties_file: Path to properties file, or an already-open
+                file object
+
+        Returns:
+            Dictionary of properties
+        """
+        if hasattr(properties_file, 'read'):
+            return self._parse_properties_lines(properties_file)
+
+        if os.path.isfile(properties_file):
+            props = _cached_parse(properties_file, self._parse_properties)
+            logger.info("Loaded Neo4j properties from %s", properties_file)
             return props
         else:
-            logger.warning(f"Properties file not found: {properties_file}, using defaults")
+            logger.warning("Properties file not found: %s, using defaults", properties_file)
             return {
                 'neo4j.uri': 'bolt://localhost:7687',
                 'neo4j.user': 'neo4j',
                 'neo4j.password': 'password',
                 'neo4j.database': 'neo4j',
-                'neo4j.batch_size': '10000',
+                'neo4j.batch_size': '20000',
                 'neo4j.default_currency': 'USD',
                 'neo4j.primary_bank': 'bank',
+                'neo4j.node_parallelism': '4',
+                'neo4j.concurrent_batches': '8',
+                'neo4j.max_pool_size': '16',
+                'neo4j.fetch_size': '20000',
                 'neo4j.create_constraints': 'true',
-                'neo4j.create_indexes': 'true'
+                'neo4j.create_indexes': 'true',
+                'neo4j.bulk_mode': 'false',
+                'neo4j.admin_path': 'neo4j-admin'
             }
 
     def get_csv_path(self, csv_key: str) -> str:
@@ -122,9 +336,7 @@ class LoaderConfig:
         Returns:
             Full path to CSV file
         """
-        output_conf = self.amlsim_conf.get('output', {})
-        filename = output_conf.get(csv_key, '')
-        return os.path.join(self.output_dir, filename)
+        return self._csv_paths.get(csv_key, self.output_dir)
 
     def csv_exists(self, csv_key: str) -> bool:
         """
@@ -137,21 +349,22 @@ class LoaderConfig:
             True if file exists
         """
         path = self.get_csv_path(csv_key)
-        return os.path.exists(path)
+        return os.path.isfile(path)
 
     def log_summary(self):
         """
         Log configuration summary
         """
-        logger.info("=" * 60)
+        logger.info(_BANNER)
         logger.info("AMLSim → Neo4j Loader Configuration")
-        logger.info("=" * 60)
-        logger.info(f"Simulation Name: {self.sim_name}")
-        logger.info(f"Base Date: {self.base_date_str}")
-        logger.info(f"Output Directory: {self.output_dir}")
-        logger.info(f"Neo4j Connection: {self.neo4j_uri}")
-        logger.info(f"Neo4j Database: {self.neo4j_database}")
-        logger.info(f"Batch Size: {self.batch_size:,}")
-        logger.info(f"Primary Bank: {self.primary_bank}")
-        logger.info(f"Default Currency: {self.default_currency}")
-        logger.info("=" * 60)
+        logger.info(_BANNER)
+        logger.info("Simulation Name: %s", self.sim_name)
+        logger.info("Base Date: %s", self.base_date_str)
+        logger.info("Output Directory: %s", self.output_dir)
+        logger.info("Neo4j Connection: %s", self.neo4j_uri)
+        logger.info("Neo4j Database: %s", self.neo4j_database)
+        logger.info("Batch Size: %s", f"{self.batch_size:,}")
+        logger.info("Primary Bank: %s", self.primary_bank)
+        logger.info("Default Currency: %s", self.default_currency)
+        logger.info("Bulk Mode: %s", self.bulk_mode)
+        logger.info(_BANNER)
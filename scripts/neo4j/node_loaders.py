@@ -4,60 +4,102 @@ Node loaders for Neo4j graph database
 Each function loads a specific node type from AMLSim CSV data.
 """
 
-import csv
 import logging
 import os
-from typing import Dict, List
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from typing import Dict, Iterator, List
 from neo4j import Driver
+from neo4j.time import Date, DateTime
 from tqdm import tqdm
 from faker import Faker
 
+from csv_io import iter_csv_rows, write_staging_csv
 from transformers import DataTransformer, get_country_name
 from config import LoaderConfig
 
 logger = logging.getLogger(__name__)
 
+# Section banner built once for the process lifetime
+_BANNER = "=" * 60
+
 
 class NodeLoader:
     """
     Handles loading of all node types into Neo4j
     """
 
-    def __init__(self, driver: Driver, config: LoaderConfig):
+    def __init__(self, driver: Driver, config: LoaderConfig, session=None):
         """
         Initialize node loader
 
         Args:
             driver: Neo4j driver instance
             config: Loader configuration
+            session: Optional shared session to reuse instead of opening new ones
         """
         self.driver = driver
         self.config = config
+        self.session = session
         self.transformer = DataTransformer(config.base_date)
         self.stats = {}
 
+    def _session(self):
+        """
+        Context manager yielding the shared session if one was provided,
+        otherwise a fresh session that is closed on exit
+
+        Sessions are not thread-safe, so the shared session is only reused
+        when node loads run sequentially; parallel workers each open their own.
+        """
+        if self.session is not None and self.config.node_parallelism <= 1:
+            return nullcontext(self.session)
+        return self.driver.session(database=self.config.neo4j_database,
+                                   fetch_size=self.config.fetch_size)
+
+    def _progress(self, **kwargs) -> tqdm:
+        """
+        Progress bar with update throttling suited to bulk loads
+
+        Refreshes at most once a second and only every batch-worth of
+        rows, so pbar.update() stays off the per-batch hot path; disabled
+        entirely when stderr is not a terminal (redirected logs would
+        otherwise fill with partial bar lines).
+        """
+        return tqdm(mininterval=1.0,
+                    miniters=max(1000, self.config.batch_size),
+                    disable=not sys.stderr.isatty(),
+                    **kwargs)
+
+    def iter_csv(self, csv_key: str) -> Iterator[Dict]:
+        """
+        Stream CSV rows as dictionaries without materializing the file
+
+        Args:
+            csv_key: Key from conf.json output section
+
+        Yields:
+            One dictionary per row
+        """
+        yield from iter_csv_rows(self.config.get_csv_path(csv_key))
+
     def load_csv(self, csv_key: str) -> List[Dict]:
         """
         Load CSV file and return list of row dictionaries
 
+        Use iter_csv for single-pass consumers; this materialized form is
+        for loaders that need multiple passes or random access.
+
         Args:
             csv_key: Key from conf.json output section
 
         Returns:
             List of dictionaries (one per row)
         """
-        filepath = self.config.get_csv_path(csv_key)
-
-        if not os.path.exists(filepath):
-            logger.warning(f"CSV file not found: {filepath}")
-            return []
+        rows = list(self.iter_csv(csv_key))
 
-        rows = []
-        with open(filepath, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-
-        logger.info(f"Loaded {len(rows):,} rows from {csv_key}")
+        logger.info("Loaded %s rows from %s", f"{len(rows):,}", csv_key)
         return rows
 
     def batch_execute(self, query: str, data: List[Dict], desc: str = "Processing"):
@@ -70,47 +112,148 @@ class NodeLoader:
             desc: Description for progress bar
         """
         if not data:
-            logger.info(f"{desc}: No data to process")
+            logger.info("%s: No data to process", desc)
             return
 
         total_rows = len(data)
-        logger.info(f"{desc}: {total_rows:,} rows")
+        logger.info("%s: %s rows", desc, f"{total_rows:,}")
+
+        batch_size = self.config.batch_size
+        batches = [data[i:i + batch_size] for i in range(0, total_rows, batch_size)]
+        workers = min(self.config.concurrent_batches, len(batches))
+
+        # Explicit transactions instead of execute_write: these are pure
+        # idempotent inserts whose failures are already surfaced to the
+        # caller, so the managed-transaction retry wrapper (and the lambda
+        # allocated per batch to feed it) is pure overhead on this hot path.
+        def run_in_tx(session, batch):
+            tx = session.begin_transaction()
+            try:
+                tx.run(query, batch=batch)
+                tx.commit()
+            except Exception:
+                tx.rollback()
+                raise
+
+        if workers <= 1:
+            with self._session() as session:
+                with self._progress(total=total_rows, desc=desc) as pbar:
+                    for i, batch in enumerate(batches):
+                        try:
+                            run_in_tx(session, batch)
+                            pbar.update(len(batch))
+                        except Exception as e:
+                            logger.error("Batch execution failed at row %s: %s", i * batch_size, e)
+                            raise
+            return
 
-        with self.driver.session() as session:
-            with tqdm(total=total_rows, desc=desc) as pbar:
-                for i in range(0, total_rows, self.config.batch_size):
-                    batch = data[i:i + self.config.batch_size]
+        # Node MERGE keys are disjoint across batches, so batches can be in
+        # flight concurrently. Each worker opens its own session (sessions
+        # are not thread-safe; the driver is).
+        def run_batch(batch):
+            with self.driver.session(database=self.config.neo4j_database,
+                                     fetch_size=self.config.fetch_size) as session:
+                run_in_tx(session, batch)
+                return len(batch)
+
+        with self._progress(total=total_rows, desc=desc) as pbar:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(run_batch, batch) for batch in batches]
+                for future in as_completed(futures):
                     try:
-                        session.execute_write(lambda tx: tx.run(query, batch=batch))
+                        pbar.update(future.result())
+                    except Exception as e:
+                        logger.error("Batch execution failed: %s", e)
+                        raise
+
+    def batch_execute_iter(self, query: str, rows: Iterator[Dict], desc: str = "Processing") -> int:
+        """
+        Execute query in batches from a row iterator (UNWIND pattern)
+
+        Unlike batch_execute, this keeps memory at O(batch_size): rows are
+        accumulated into one batch at a time and flushed as they stream in.
+
+        Queries passed here may use CALL { ... } IN TRANSACTIONS to let the
+        server commit sub-batches while Python streams the next batch, so
+        each batch runs as an implicit auto-commit transaction (session.run)
+        rather than inside execute_write - Cypher forbids IN TRANSACTIONS
+        inside an explicit transaction.
+
+        Args:
+            query: Cypher query with $batch parameter
+            rows: Iterable of parameter dictionaries
+            desc: Description for progress bar
+
+        Returns:
+            Number of rows written
+        """
+        batch_size = self.config.batch_size
+        total = 0
+        batch = []
+
+        with self._session() as session:
+            with self._progress(desc=desc, unit="rows") as pbar:
+                for row in rows:
+                    batch.append(row)
+                    if len(batch) >= batch_size:
+                        try:
+                            session.run(query, batch=batch).consume()
+                        except Exception as e:
+                            logger.error("Batch execution failed at row %s: %s", total, e)
+                            raise
+                        total += len(batch)
                         pbar.update(len(batch))
+                        batch = []
+
+                if batch:
+                    try:
+                        session.run(query, batch=batch).consume()
                     except Exception as e:
-                        logger.error(f"Batch execution failed at row {i}: {e}")
+                        logger.error("Batch execution failed at row %s: %s", total, e)
                         raise
+                    total += len(batch)
+                    pbar.update(len(batch))
+
+        if total == 0:
+            logger.info("%s: No data to process", desc)
+
+        return total
+
+    def _ensure_constraints(self):
+        """
+        Make sure the MERGE-key constraints exist before any node load
+
+        Without a uniqueness constraint every MERGE is a label scan, which
+        is quadratic over a whole load. Schema setup normally runs first,
+        but it can be disabled by config or skipped by standalone callers,
+        so the loads guarantee their own index-backed MERGE keys here.
+        Constraint creation is IF NOT EXISTS and therefore free when the
+        schema phase already ran.
+        """
+        from schema import SchemaManager
+        SchemaManager(self.driver, database=self.config.neo4j_database).create_constraints()
 
-    def load_countries(self):
+    def load_countries(self, accounts: List[Dict] = None):
         """
         Load Country nodes from unique country codes in accounts.csv
+
+        Args:
+            accounts: Pre-loaded accounts.csv rows (read on demand if None)
         """
         logger.info("Loading Countries...")
 
-        accounts = self.load_csv('accounts')
+        if accounts is None:
+            accounts = self.load_csv('accounts')
         if not accounts:
             return
 
-        # Extract unique country codes
-        country_codes = set()
-        for row in accounts:
-            code = row.get('country', 'US').strip()
-            if code:
-                country_codes.add(code)
-
-        # Prepare country data
-        countries = []
-        for code in country_codes:
-            countries.append({
-                "code": code,
-                "name": get_country_name(code)
-            })
+        # Single pass: dedupe codes with a set comprehension and build the
+        # parameter list straight from it, skipping the intermediate loop
+        country_codes = {row.get('country', 'US').strip() for row in accounts}
+        country_codes.discard('')
+
+        countries = [{"code": code, "name": get_country_name(code)}
+                     for code in country_codes]
 
         # Load into Neo4j
         query = """
@@ -121,41 +264,47 @@ class NodeLoader:
 
         self.batch_execute(query, countries, "Loading Countries")
         self.stats["Country"] = len(countries)
-        logger.info(f"Loaded {len(countries)} countries")
+        logger.info("Loaded %s countries", len(countries))
 
-    def load_customers(self):
+    def load_customers(self, accounts: List[Dict] = None, mappings: List[Dict] = None):
         """
         Load Customer nodes enriched with personal data from accounts.csv
 
         Since AMLSim generates rich Faker data in accounts.csv but leaves
         party CSVs mostly blank, we copy personal data from accounts to customers.
+
+        Args:
+            accounts: Pre-loaded accounts.csv rows (read on demand if None)
+            mappings: Pre-loaded account_mapping.csv rows (read on demand if None)
         """
         logger.info("Loading Customers...")
 
         # Load source data
         individuals = self.load_csv('party_individuals')
         organizations = self.load_csv('party_organizations')
-        accounts = self.load_csv('accounts')
-        mappings = self.load_csv('account_mapping')
+        if accounts is None:
+            accounts = self.load_csv('accounts')
+        if mappings is None:
+            mappings = self.load_csv('account_mapping')
 
         if not accounts or not mappings:
             logger.warning("Missing accounts.csv or account_mapping.csv - cannot enrich customer data")
             return
 
-        # Build customer_id → account_data lookup
-        cust_to_acct = {}
-        for row in mappings:
-            cust_id = row.get('cust_id', '').strip()
-            acct_id = row.get('acct_id', '').strip()
-            if cust_id and acct_id:
-                cust_to_acct[cust_id] = acct_id
-
-        # Build account_id → account_data lookup
-        acct_data = {}
-        for row in accounts:
-            acct_id = row.get('acct_id', '').strip()
-            if acct_id:
-                acct_data[acct_id] = row
+        # Build customer_id → account_id lookup
+        cust_to_acct = {row.get('cust_id', '').strip(): row.get('acct_id', '').strip()
+                        for row in mappings
+                        if row.get('cust_id', '').strip() and row.get('acct_id', '').strip()}
+
+        # Project just the enrichment fields into a tuple per account
+        # instead of keeping a reference to the full row dict - smaller,
+        # and the consumer unpacks in one step
+        empty_acct = ('', '', '', '')
+        acct_data = {row['acct_id'].strip(): (row.get('first_name', ''),
+                                              row.get('last_name', ''),
+                                              row.get('gender', ''),
+                                              row.get('birth_date', ''))
+                     for row in accounts if row.get('acct_id', '').strip()}
 
         # Process individuals - enrich from accounts
         individual_customers = []
@@ -166,35 +315,35 @@ class NodeLoader:
 
             # Get linked account data
             acct_id = cust_to_acct.get(party_id)
-            acct_row = acct_data.get(acct_id, {}) if acct_id else {}
+            first_name, last_name, gender, birth_date = acct_data.get(acct_id, empty_acct)
 
             individual_customers.append({
                 "customerId": party_id,
                 "partyType": "Individual",
-                "firstName": acct_row.get('first_name', ''),
-                "lastName": acct_row.get('last_name', ''),
+                "firstName": first_name,
+                "lastName": last_name,
                 "middleName": '',  # Not in accounts.csv
                 "nationality": row.get('nationality', 'US'),
-                "gender": acct_row.get('gender', ''),
-                "birthDate": acct_row.get('birth_date', ''),
+                "gender": gender,
+                "birthDate": Date.from_iso_format(birth_date) if birth_date else None,
             })
 
-        # Process organizations - enrich from accounts + generate company names
+        # Process organizations - enrich from accounts + generate company names.
+        # Constructing Faker builds its full provider registry, so do it
+        # once; reseeding the instance per org keeps the names deterministic
+        # while costing microseconds instead of milliseconds per row.
+        fake = Faker(['en_US'])
+
         organization_customers = []
         for row in organizations:
             party_id = row.get('partyId', '').strip()
             if not party_id:
                 continue
 
-            # Generate synthetic company name with deterministic seed per org
-            Faker.seed(int(party_id))
-            fake = Faker(['en_US'])
+            # Deterministic seed per org
+            fake.seed_instance(int(party_id))
             company_name = fake.company()
 
-            # Get linked account data for any available fields
-            acct_id = cust_to_acct.get(party_id)
-            acct_row = acct_data.get(acct_id, {}) if acct_id else {}
-
             organization_customers.append({
                 "customerId": party_id,
                 "partyType": "Organization",
@@ -202,82 +351,88 @@ class NodeLoader:
                 "legalName": company_name,
             })
 
-        # Load individuals
-        individual_query = """
-        UNWIND $batch AS row
-        MERGE (c:Customer:Individual {customerId: row.customerId})
-        SET c.partyType = row.partyType,
-            c.firstName = row.firstName,
-            c.lastName = row.lastName,
-            c.middleName = row.middleName,
-            c.nationality = row.nationality,
-            c.gender = row.gender,
-            c.birthDate = CASE WHEN row.birthDate <> '' THEN date(row.birthDate) ELSE null END
-        """
-
-        self.batch_execute(individual_query, individual_customers, "Loading Individual Customers")
-
-        # Load organizations
-        organization_query = """
+        # One UNWIND covers both party types: the secondary label and its
+        # type-specific properties are set via FOREACH-over-CASE, halving
+        # the round trips of separate Individual/Organization passes
+        customer_query = """
         UNWIND $batch AS row
-        MERGE (c:Customer:Organization {customerId: row.customerId})
-        SET c.partyType = row.partyType,
-            c.name = row.name,
-            c.legalName = row.legalName
+        MERGE (c:Customer {customerId: row.customerId})
+        SET c.partyType = row.partyType
+        FOREACH (_ IN CASE WHEN row.partyType = 'Individual' THEN [1] ELSE [] END |
+            SET c:Individual,
+                c.firstName = row.firstName,
+                c.lastName = row.lastName,
+                c.middleName = row.middleName,
+                c.nationality = row.nationality,
+                c.gender = row.gender,
+                c.birthDate = row.birthDate)
+        FOREACH (_ IN CASE WHEN row.partyType = 'Organization' THEN [1] ELSE [] END |
+            SET c:Organization,
+                c.name = row.name,
+                c.legalName = row.legalName)
         """
 
-        self.batch_execute(organization_query, organization_customers, "Loading Organization Customers")
+        self.batch_execute(customer_query,
+                           individual_customers + organization_customers,
+                           "Loading Customers")
 
         self.stats["Customer:Individual"] = len(individual_customers)
         self.stats["Customer:Organization"] = len(organization_customers)
         self.stats["Customer"] = len(individual_customers) + len(organization_customers)
 
-        logger.info(f"Loaded {self.stats['Customer']} customers " +
-                   f"({self.stats['Customer:Individual']} individuals, " +
-                   f"{self.stats['Customer:Organization']} organizations)")
+        logger.info("Loaded %s customers (%s individuals, %s organizations)",
+                   self.stats['Customer'],
+                   self.stats['Customer:Individual'],
+                   self.stats['Customer:Organization'])
 
-    def load_addresses(self):
+    def load_addresses(self, accounts: List[Dict] = None):
         """
         Load Address nodes (deduplicated) from accounts.csv
+
+        Args:
+            accounts: Pre-loaded accounts.csv rows (read on demand if None)
         """
         logger.info("Loading Addresses...")
 
-        accounts = self.load_csv('accounts')
+        if accounts is None:
+            accounts = self.load_csv('accounts')
         if not accounts:
             return
 
-        # Deduplicate addresses using hash
-        address_map = {}
+        # Deduplicate addresses using hash. A seen-set plus a flat list
+        # keeps only the hashes as keys instead of a hash->dict mapping,
+        # and skips building the row dict for duplicates entirely.
+        #
+        # The hash stays normalize_address_key so it matches the keys the
+        # relationship loaders compute for HAS_ADDRESS/LOCATED_IN joins.
+        seen = set()
+        addresses = []
+        created_at = DateTime.from_native(self.config.base_date)
+
         for row in accounts:
             street = row.get('street_addr', '').strip()
             city = row.get('city', '').strip()
             postcode = row.get('zip', '').strip()
-            state = row.get('state', '').strip()
-            country = row.get('country', 'US').strip()
 
             if not (street and city and postcode):
                 continue
 
-            # Generate hash for deduplication
             addr_hash = self.transformer.normalize_address_key(street, city, postcode)
-
-            if addr_hash not in address_map:
-                lat = self.transformer.parse_float(row.get('lat'))
-                lon = self.transformer.parse_float(row.get('lon'))
-
-                address_map[addr_hash] = {
-                    "addressHash": addr_hash,
-                    "addressLine1": street,
-                    "postTown": city,
-                    "postCode": postcode,
-                    "region": state,
-                    "country": country,
-                    "latitude": lat,
-                    "longitude": lon,
-                    "createdAt": self.config.base_date.isoformat()
-                }
-
-        addresses = list(address_map.values())
+            if addr_hash in seen:
+                continue
+            seen.add(addr_hash)
+
+            addresses.append({
+                "addressHash": addr_hash,
+                "addressLine1": street,
+                "postTown": city,
+                "postCode": postcode,
+                "region": row.get('state', '').strip(),
+                "country": row.get('country', 'US').strip(),
+                "latitude": self.transformer.parse_float(row.get('lat')),
+                "longitude": self.transformer.parse_float(row.get('lon')),
+                "createdAt": created_at
+            })
 
         query = """
         UNWIND $batch AS row
@@ -290,232 +445,436 @@ class NodeLoader:
             a.country = row.country,
             a.latitude = row.latitude,
             a.longitude = row.longitude,
-            a.createdAt = datetime(row.createdAt)
+            a.createdAt = row.createdAt
         """
 
         self.batch_execute(query, addresses, "Loading Addresses")
         self.stats["Address"] = len(addresses)
-        logger.info(f"Loaded {len(addresses)} unique addresses")
+        logger.info("Loaded %s unique addresses", len(addresses))
 
-    def load_ssn_nodes(self):
+    def load_ssn_nodes(self, accounts: List[Dict] = None):
         """
         Load SSN nodes from accounts.csv (for individual customers)
+
+        Args:
+            accounts: Pre-loaded accounts.csv rows (read on demand if None)
         """
         logger.info("Loading SSN nodes...")
 
-        accounts = self.load_csv('accounts')
+        if accounts is None:
+            accounts = self.load_csv('accounts')
         if not accounts:
             return
 
-        ssn_data = []
-        for row in accounts:
-            ssn = row.get('ssn', '').strip()
-            if ssn:
-                ssn_data.append({
-                    "ssnNumber": ssn,
-                    "createdAt": self.config.base_date.isoformat()
-                })
+        # Dedupe on the raw SSN strings first, then build one dict per
+        # unique SSN - the old path built a dict per row and threw the
+        # duplicates away
+        created_at = DateTime.from_native(self.config.base_date)
+        unique_ssns = {row.get('ssn', '').strip() for row in accounts}
+        unique_ssns.discard('')
 
-        # Deduplicate SSNs
-        unique_ssns = {item["ssnNumber"]: item for item in ssn_data}.values()
-        ssn_list = list(unique_ssns)
+        ssn_list = [{"ssnNumber": ssn, "createdAt": created_at}
+                    for ssn in unique_ssns]
 
         query = """
         UNWIND $batch AS row
         MERGE (s:SSN {ssnNumber: row.ssnNumber})
-        ON CREATE SET s.createdAt = datetime(row.createdAt)
+        ON CREATE SET s.createdAt = row.createdAt
         """
 
         self.batch_execute(query, ssn_list, "Loading SSN Nodes")
         self.stats["SSN"] = len(ssn_list)
-        logger.info(f"Loaded {len(ssn_list)} unique SSN nodes")
+        logger.info("Loaded %s unique SSN nodes", len(ssn_list))
 
-    def load_accounts(self):
+    def load_accounts(self, accounts_data: List[Dict] = None):
         """
         Load Account nodes from accounts.csv
+
+        Args:
+            accounts_data: Pre-loaded accounts.csv rows (read on demand if None)
         """
         logger.info("Loading Accounts...")
 
-        accounts_data = self.load_csv('accounts')
+        if accounts_data is None:
+            accounts_data = self.load_csv('accounts')
         if not accounts_data:
             return
 
+        # Hot loop: hoist config/transformer lookups to locals so each of
+        # the N rows pays plain fast-local calls instead of repeated
+        # attribute chains
+        primary_bank = self.config.primary_bank
+        parse_boolean = self.transformer.parse_boolean
+        parse_int = self.transformer.parse_int
+        parse_float = self.transformer.parse_float
+
+        # Dates are converted up front through the memoized batch path:
+        # the distinct open/close offsets number in the hundreds while
+        # accounts number in the millions, so each datetime is built once
+        # instead of once per row
+        open_dates = self.transformer.days_to_datetime_batch(
+            [row.get('open_dt', 0) for row in accounts_data])
+        close_dates = self.transformer.days_to_datetime_batch(
+            [row.get('close_dt', 1000000) for row in accounts_data])
+
         accounts = []
-        for row in accounts_data:
+        for row, open_date, close_date in zip(accounts_data, open_dates, close_dates):
             acct_id = row.get('acct_id', '').strip()
             if not acct_id:
                 continue
 
             # Determine if Internal or External based on bank_id
-            bank_id = row.get('bank_id', self.config.primary_bank).strip()
-            is_internal = (bank_id == self.config.primary_bank)
+            bank_id = row.get('bank_id', primary_bank).strip()
+            is_internal = (bank_id == primary_bank)
 
             # Check if SAR account
-            is_sar = self.transformer.parse_boolean(row.get('prior_sar_count', False))
-
-            # Parse dates
-            open_date = self.transformer.days_to_datetime(row.get('open_dt', 0))
-            close_date = self.transformer.days_to_datetime(row.get('close_dt', 1000000))
+            is_sar = parse_boolean(row.get('prior_sar_count', False))
 
             accounts.append({
                 "accountNumber": acct_id,
                 "isInternal": is_internal,
                 "isSAR": is_sar,
                 "accountType": row.get('type', 'SAV'),
-                "openDate": open_date.isoformat() if open_date else None,
-                "closedDate": close_date.isoformat() if close_date else None,
-                "tx_behavior_id": self.transformer.parse_int(row.get('tx_behavior_id')),
-                "prior_sar_count": is_sar,
-                "initial_deposit": self.transformer.parse_float(row.get('initial_deposit')),
-                "branch_id": self.transformer.parse_int(row.get('branch_id')),
-                "bank_id": bank_id,
-                "country": row.get('country', 'US')
+                "openDate": DateTime.from_native(open_date) if open_date else None,
+                "closedDate": DateTime.from_native(close_date) if close_date else None,
+                "tx_behavior_id": parse_int(row.get('tx_behavior_id')),
+                "initial_deposit": parse_float(row.get('initial_deposit')),
+                "branch_id": parse_int(row.get('branch_id')),
+                "bank_id": bank_id
             })
 
-        # Load accounts with base properties
+        # Load accounts with base properties and labels in one pass.
+        # The FOREACH-over-CASE trick sets each conditional label inside
+        # the same MERGE, instead of re-matching the full account set in
+        # follow-up UNWIND queries per label.
         query = """
         UNWIND $batch AS row
         MERGE (a:Account {accountNumber: row.accountNumber})
         SET a.accountType = row.accountType,
-            a.openDate = CASE WHEN row.openDate IS NOT NULL THEN datetime(row.openDate) ELSE null END,
-            a.closedDate = CASE WHEN row.closedDate IS NOT NULL THEN datetime(row.closedDate) ELSE null END,
+            a.openDate = row.openDate,
+            a.closedDate = row.closedDate,
             a.tx_behavior_id = row.tx_behavior_id,
-            a.prior_sar_count = row.prior_sar_count,
+            a.prior_sar_count = row.isSAR,
             a.initial_deposit = row.initial_deposit,
             a.branch_id = row.branch_id,
             a.bank_id = row.bank_id
+        FOREACH (_ IN CASE WHEN row.isInternal THEN [1] ELSE [] END | SET a:Internal)
+        FOREACH (_ IN CASE WHEN NOT row.isInternal THEN [1] ELSE [] END | SET a:External)
+        FOREACH (_ IN CASE WHEN row.isSAR THEN [1] ELSE [] END | SET a:SARAccount)
         """
 
         self.batch_execute(query, accounts, "Loading Accounts")
 
-        # Add Internal/External labels
-        self._add_account_labels(accounts)
+        internal_count = sum(1 for a in accounts if a["isInternal"])
+        sar_count = sum(1 for a in accounts if a["isSAR"])
 
         self.stats["Account"] = len(accounts)
-        logger.info(f"Loaded {len(accounts)} accounts")
-
-    def _add_account_labels(self, accounts: List[Dict]):
-        """
-        Add Internal/External/SARAccount labels to accounts
-        """
-        logger.info("Adding account labels...")
-
-        # Add Internal label
-        internal_accounts = [a for a in accounts if a["isInternal"]]
-        if internal_accounts:
-            query = """
-            UNWIND $batch AS row
-            MATCH (a:Account {accountNumber: row.accountNumber})
-            SET a:Internal
-            """
-            self.batch_execute(query, internal_accounts, "Adding Internal labels")
-
-        # Add External label
-        external_accounts = [a for a in accounts if not a["isInternal"]]
-        if external_accounts:
-            query = """
-            UNWIND $batch AS row
-            MATCH (a:Account {accountNumber: row.accountNumber})
-            SET a:External
-            """
-            self.batch_execute(query, external_accounts, "Adding External labels")
-
-        # Add SARAccount label
-        sar_accounts = [a for a in accounts if a["isSAR"]]
-        if sar_accounts:
-            query = """
-            UNWIND $batch AS row
-            MATCH (a:Account {accountNumber: row.accountNumber})
-            SET a:SARAccount
-            """
-            self.batch_execute(query, sar_accounts, "Adding SARAccount labels")
-
-        logger.info(f"Added labels: {len(internal_accounts)} Internal, " +
-                   f"{len(external_accounts)} External, {len(sar_accounts)} SAR")
+        logger.info("Loaded %s accounts (%s Internal, %s External, %s SAR)",
+                    len(accounts), internal_count,
+                    len(accounts) - internal_count, sar_count)
 
     def load_transactions(self):
         """
         Load Transaction nodes from transactions.csv
+
+        Rows are streamed straight from the CSV into batches, so memory
+        stays at O(batch_size) regardless of transaction count.
         """
         logger.info("Loading Transactions...")
 
-        transactions_data = self.load_csv('transactions')
-        if not transactions_data:
-            return
+        # SAR transaction count tallied while streaming (for stats only;
+        # the label itself is set in the main MERGE below)
+        sar_count = [0]
+
+        def transaction_rows():
+            for row in self.iter_csv('transactions'):
+                tx_id = row.get('tran_id', '').strip()
+                if not tx_id:
+                    continue
+
+                # Parse date (handles ISO 8601, YYYYMMDD, and other formats)
+                date_str = row.get('tran_timestamp', '').strip()
+                tx_date = self.transformer.parse_datetime(date_str, column_key='tran_timestamp')
+
+                # Parse SAR flag
+                is_sar = self.transformer.parse_boolean(row.get('is_sar', False))
+                if is_sar:
+                    sar_count[0] += 1
+
+                # Parse alert_id
+                alert_id = self.transformer.parse_int(row.get('alert_id', -1))
+                if alert_id == -1:
+                    alert_id = None
+
+                # Positional list, unpacked by the WITH clause below; at
+                # tens of millions of rows this is markedly smaller than a
+                # per-row dict, both in Python heap and on the Bolt wire
+                yield [
+                    tx_id,
+                    self.transformer.parse_float(row.get('base_amt')),
+                    self.config.default_currency,
+                    DateTime.from_native(tx_date) if tx_date else None,
+                    row.get('tx_type', ''),
+                    is_sar,
+                    alert_id
+                ]
+
+        # Load transactions; the SARTransaction label is set conditionally
+        # in the same MERGE rather than by a follow-up MATCH pass. The CALL
+        # subquery has the server commit 5,000-row sub-batches on its own,
+        # overlapping commit work with Python streaming the next batch and
+        # keeping transaction state small regardless of batch_size.
+        query = """
+        UNWIND $batch AS row
+        CALL {
+            WITH row
+            WITH row[0] AS transactionId, row[1] AS amount, row[2] AS currency,
+                 row[3] AS date, row[4] AS type, row[5] AS isSAR, row[6] AS alertId
+            MERGE (t:Transaction {transactionId: transactionId})
+            SET t.amount = amount,
+                t.currency = currency,
+                t.date = date,
+                t.type = type,
+                t.is_sar = isSAR,
+                t.alert_id = alertId
+            FOREACH (_ IN CASE WHEN isSAR THEN [1] ELSE [] END | SET t:SARTransaction)
+        } IN TRANSACTIONS OF 5000 ROWS
+        """
 
-        transactions = []
+        total = self.batch_execute_iter(query, transaction_rows(), "Loading Transactions")
+        if total == 0:
+            return
 
-        for row in transactions_data:
-            tx_id = row.get('tran_id', '').strip()
-            if not tx_id:
-                continue
+        self.stats["Transaction"] = total
+        self.stats["SARTransaction"] = sar_count[0]
 
-            # Parse date (handles ISO 8601, YYYYMMDD, and other formats)
-            date_str = row.get('tran_timestamp', '').strip()
-            tx_date = self.transformer.parse_datetime(date_str)
+        logger.info("Loaded %s transactions (%s SARs)", total, sar_count[0])
 
-            # Parse SAR flag
-            is_sar = self.transformer.parse_boolean(row.get('is_sar', False))
+    def emit_admin_import_csvs(self, staging_dir: str) -> List[str]:
+        """
+        Stage node CSVs for neo4j-admin database import
 
-            # Parse alert_id
-            alert_id = self.transformer.parse_int(row.get('alert_id', -1))
-            if alert_id == -1:
-                alert_id = None
+        Writes one header+data CSV per node label, with typed admin-import
+        headers (customerId:ID(Customer), :LABEL, latitude:double, ...).
+        The projection logic mirrors the UNWIND loaders above, so a bulk
+        import produces the same graph as an incremental load - only the
+        write path differs: neo4j-admin builds the store files directly,
+        bypassing Bolt and the transaction log entirely.
 
-            transactions.append({
-                "transactionId": tx_id,
-                "isSAR": is_sar,
-                "amount": self.transformer.parse_float(row.get('base_amt')),
-                "currency": self.config.default_currency,
-                "date": tx_date.isoformat() if tx_date else None,
-                "type": row.get('tx_type', ''),
-                "is_sar": is_sar,
-                "alert_id": alert_id
-            })
+        Args:
+            staging_dir: Directory receiving the staged CSV files
 
-        # Load transactions
-        query = """
-        UNWIND $batch AS row
-        MERGE (t:Transaction {transactionId: row.transactionId})
-        SET t.amount = row.amount,
-            t.currency = row.currency,
-            t.date = CASE WHEN row.date IS NOT NULL THEN datetime(row.date) ELSE null END,
-            t.type = row.type,
-            t.is_sar = row.is_sar,
-            t.alert_id = row.alert_id
+        Returns:
+            Paths of the staged files, one per --nodes= argument
         """
+        logger.info("Staging node CSVs for neo4j-admin import in %s", staging_dir)
 
-        self.batch_execute(query, transactions, "Loading Transactions")
-
-        # Add SARTransaction label
-        sar_transactions = [t for t in transactions if t["isSAR"]]
-        if sar_transactions:
-            sar_query = """
-            UNWIND $batch AS row
-            MATCH (t:Transaction {transactionId: row.transactionId})
-            SET t:SARTransaction
-            """
-            self.batch_execute(sar_query, sar_transactions, "Adding SARTransaction labels")
-
-        self.stats["Transaction"] = len(transactions)
-        self.stats["SARTransaction"] = len(sar_transactions)
+        accounts = self.load_csv('accounts')
+        mappings = self.load_csv('account_mapping')
+        individuals = self.load_csv('party_individuals')
+        organizations = self.load_csv('party_organizations')
+        base_iso = self.config.base_date.isoformat()
+        paths = []
+
+        def emit(filename, header, rows):
+            path = os.path.join(staging_dir, filename)
+            count = write_staging_csv(path, header, rows)
+            paths.append(path)
+            return count
+
+        # Countries (deduped codes, same as load_countries)
+        country_codes = {row.get('country', 'US').strip() for row in accounts}
+        country_codes.discard('')
+        self.stats["Country"] = emit(
+            'nodes_country.csv',
+            ['code:ID(Country)', 'name', ':LABEL'],
+            ([code, get_country_name(code), 'Country'] for code in country_codes))
+
+        # Customers, enriched from accounts.csv like load_customers
+        cust_to_acct = {row.get('cust_id', '').strip(): row.get('acct_id', '').strip()
+                        for row in mappings
+                        if row.get('cust_id', '').strip() and row.get('acct_id', '').strip()}
+        empty_acct = ('', '', '', '')
+        acct_data = {row['acct_id'].strip(): (row.get('first_name', ''),
+                                              row.get('last_name', ''),
+                                              row.get('gender', ''),
+                                              row.get('birth_date', ''))
+                     for row in accounts if row.get('acct_id', '').strip()}
+
+        def customer_rows():
+            individual_count = 0
+            for row in individuals:
+                party_id = row.get('partyId', '').strip()
+                if not party_id:
+                    continue
+                first_name, last_name, gender, birth_date = \
+                    acct_data.get(cust_to_acct.get(party_id), empty_acct)
+                individual_count += 1
+                yield [party_id, 'Individual', first_name, last_name, '',
+                       row.get('nationality', 'US'), gender, birth_date,
+                       '', '', 'Customer;Individual']
+            self.stats["Customer:Individual"] = individual_count
 
-        logger.info(f"Loaded {len(transactions)} transactions ({len(sar_transactions)} SARs)")
+            fake = Faker(['en_US'])
+            organization_count = 0
+            for row in organizations:
+                party_id = row.get('partyId', '').strip()
+                if not party_id:
+                    continue
+                fake.seed_instance(int(party_id))
+                company_name = fake.company()
+                organization_count += 1
+                yield [party_id, 'Organization', '', '', '', '', '', '',
+                       company_name, company_name, 'Customer;Organization']
+            self.stats["Customer:Organization"] = organization_count
+
+        self.stats["Customer"] = emit(
+            'nodes_customer.csv',
+            ['customerId:ID(Customer)', 'partyType', 'firstName', 'lastName',
+             'middleName', 'nationality', 'gender', 'birthDate:date',
+             'name', 'legalName', ':LABEL'],
+            customer_rows())
+
+        # Addresses, deduped on the same normalized hash the relationship
+        # stage uses for its :END_ID values
+        def address_rows():
+            seen = set()
+            for row in accounts:
+                street = row.get('street_addr', '').strip()
+                city = row.get('city', '').strip()
+                postcode = row.get('zip', '').strip()
+                if not (street and city and postcode):
+                    continue
+                addr_hash = self.transformer.normalize_address_key(street, city, postcode)
+                if addr_hash in seen:
+                    continue
+                seen.add(addr_hash)
+                yield [addr_hash, street, city, postcode,
+                       row.get('state', '').strip(), row.get('country', 'US').strip(),
+                       row.get('lat', ''), row.get('lon', ''), base_iso, 'Address']
+
+        self.stats["Address"] = emit(
+            'nodes_address.csv',
+            ['addressHash:ID(Address)', 'addressLine1', 'postTown', 'postCode',
+             'region', 'country', 'latitude:double', 'longitude:double',
+             'createdAt:datetime', ':LABEL'],
+            address_rows())
+
+        # SSNs (deduped raw strings, same as load_ssn_nodes)
+        unique_ssns = {row.get('ssn', '').strip() for row in accounts}
+        unique_ssns.discard('')
+        self.stats["SSN"] = emit(
+            'nodes_ssn.csv',
+            ['ssnNumber:ID(SSN)', 'createdAt:datetime', ':LABEL'],
+            ([ssn, base_iso, 'SSN'] for ssn in unique_ssns))
+
+        # Accounts, with the conditional labels folded into :LABEL
+        primary_bank = self.config.primary_bank
+        parse_boolean = self.transformer.parse_boolean
+        days_to_datetime_batch = self.transformer.days_to_datetime_batch
+
+        def account_rows():
+            # Same memoized batch conversion as load_accounts: one
+            # datetime per distinct offset instead of one per row
+            open_dates = days_to_datetime_batch(
+                [row.get('open_dt', 0) for row in accounts])
+            close_dates = days_to_datetime_batch(
+                [row.get('close_dt', 1000000) for row in accounts])
+            for row, open_date, close_date in zip(accounts, open_dates, close_dates):
+                acct_id = row.get('acct_id', '').strip()
+                if not acct_id:
+                    continue
+                bank_id = row.get('bank_id', primary_bank).strip()
+                is_sar = parse_boolean(row.get('prior_sar_count', False))
+                labels = 'Account;Internal' if bank_id == primary_bank else 'Account;External'
+                if is_sar:
+                    labels += ';SARAccount'
+                yield [acct_id, row.get('type', 'SAV'),
+                       open_date.isoformat() if open_date else '',
+                       close_date.isoformat() if close_date else '',
+                       row.get('tx_behavior_id', ''), str(is_sar).lower(),
+                       row.get('initial_deposit', ''), row.get('branch_id', ''),
+                       bank_id, labels]
+
+        self.stats["Account"] = emit(
+            'nodes_account.csv',
+            ['accountNumber:ID(Account)', 'accountType', 'openDate:datetime',
+             'closedDate:datetime', 'tx_behavior_id:int', 'prior_sar_count:boolean',
+             'initial_deposit:double', 'branch_id:int', 'bank_id', ':LABEL'],
+            account_rows())
+
+        # Transactions, streamed straight from transactions.csv
+        default_currency = self.config.default_currency
+        parse_datetime = self.transformer.parse_datetime
+        parse_int = self.transformer.parse_int
+
+        def transaction_rows():
+            sar_count = 0
+            for row in self.iter_csv('transactions'):
+                tx_id = row.get('tran_id', '').strip()
+                if not tx_id:
+                    continue
+                tx_date = parse_datetime(row.get('tran_timestamp', '').strip(),
+                                         column_key='tran_timestamp')
+                is_sar = parse_boolean(row.get('is_sar', False))
+                alert_id = parse_int(row.get('alert_id', -1))
+                if is_sar:
+                    sar_count += 1
+                yield [tx_id, row.get('base_amt', ''), default_currency,
+                       tx_date.isoformat() if tx_date else '',
+                       row.get('tx_type', ''), str(is_sar).lower(),
+                       alert_id if alert_id != -1 and alert_id is not None else '',
+                       'Transaction;SARTransaction' if is_sar else 'Transaction']
+            self.stats["SARTransaction"] = sar_count
+
+        self.stats["Transaction"] = emit(
+            'nodes_transaction.csv',
+            ['transactionId:ID(Transaction)', 'amount:double', 'currency',
+             'date:datetime', 'type', 'is_sar:boolean', 'alert_id:int', ':LABEL'],
+            transaction_rows())
+
+        logger.info("Staged %s node CSV files", len(paths))
+        return paths
 
     def load_all_nodes(self):
         """
-        Load all node types in correct order
+        Load all node types
+
+        Node labels share no write locks with each other, so the per-label
+        loads are independent and can run in parallel (unlike relationship
+        loads, which lock their endpoint nodes).
         """
-        logger.info("\n" + "=" * 60)
+        logger.info("\n%s", _BANNER)
         logger.info("Loading Nodes")
-        logger.info("=" * 60)
-
-        self.load_countries()
-        self.load_customers()
-        self.load_addresses()
-        self.load_ssn_nodes()
-        self.load_accounts()
-        self.load_transactions()
+        logger.info(_BANNER)
+
+        self._ensure_constraints()
+
+        # accounts.csv feeds five of the six loaders; read and parse it
+        # once here instead of once per loader. The rows are read-only
+        # from this point, so sharing them across workers is safe.
+        accounts = self.load_csv('accounts')
+        mappings = self.load_csv('account_mapping')
+
+        loaders = [
+            lambda: self.load_countries(accounts),
+            lambda: self.load_customers(accounts, mappings),
+            lambda: self.load_addresses(accounts),
+            lambda: self.load_ssn_nodes(accounts),
+            lambda: self.load_accounts(accounts),
+            self.load_transactions,
+        ]
+
+        parallelism = self.config.node_parallelism
+        if parallelism > 1:
+            logger.info("Loading node labels with %s parallel workers", parallelism)
+            with ThreadPoolExecutor(max_workers=parallelism) as executor:
+                futures = [executor.submit(loader) for loader in loaders]
+                for future in futures:
+                    future.result()
+        else:
+            for loader in loaders:
+                loader()
 
         logger.info("\nNode loading complete")
         return self.stats
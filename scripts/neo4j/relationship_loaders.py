@@ -7,85 +7,359 @@ Each function loads a specific relationship type from AMLSim CSV data.
 import csv
 import logging
 import os
-from typing import Dict, List
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from typing import Dict, Iterator, List
 from neo4j import Driver
+from neo4j.time import DateTime
 from tqdm import tqdm
 
+from csv_io import iter_csv_rows, write_staging_csv
 from transformers import DataTransformer
 from config import LoaderConfig
 
 logger = logging.getLogger(__name__)
 
+# Section banner built once for the process lifetime
+_BANNER = "=" * 60
+
+# Cypher for each relationship type, at module level so every batch runs
+# the exact same string object and the server's query-plan cache always
+# hits. The materialized loaders send their payloads as parallel column
+# lists (one parameter per field) that the queries index positionally -
+# field names travel once per batch instead of once per row, and Python
+# allocates plain lists of strings instead of a dict per row. Invariant
+# fields are set from $baseDate or literals (see batch_execute's params
+# argument).
+_HAS_ACCOUNT_CYPHER = """
+UNWIND range(0, size($custIds) - 1) AS i
+MATCH (c:Customer {customerId: $custIds[i]})
+MATCH (a:Account {accountNumber: $acctNums[i]})
+MERGE (c)-[r:HAS_ACCOUNT]->(a)
+SET r.role = $roles[i],
+    r.since = $baseDate
+"""
+
+_HAS_ADDRESS_CYPHER = """
+UNWIND range(0, size($custIds) - 1) AS i
+MATCH (c:Customer {customerId: $custIds[i]})
+MATCH (addr:Address {addressHash: $addressHashes[i]})
+MERGE (c)-[r:HAS_ADDRESS]->(addr)
+SET r.addedAt = $baseDate,
+    r.lastChangedAt = $baseDate,
+    r.isCurrent = true
+"""
+
+_LOCATED_IN_CYPHER = """
+UNWIND range(0, size($addressHashes) - 1) AS i
+MATCH (addr:Address {addressHash: $addressHashes[i]})
+MATCH (c:Country {code: $countryCodes[i]})
+MERGE (addr)-[:LOCATED_IN]->(c)
+"""
+
+_IS_HOSTED_CYPHER = """
+UNWIND range(0, size($accountNumbers) - 1) AS i
+MATCH (a:Account {accountNumber: $accountNumbers[i]})
+MATCH (c:Country {code: $countryCodes[i]})
+MERGE (a)-[:IS_HOSTED]->(c)
+"""
+
+_HAS_NATIONALITY_CYPHER = """
+UNWIND range(0, size($custIds) - 1) AS i
+MATCH (c:Customer {customerId: $custIds[i]})
+MATCH (country:Country {code: $countryCodes[i]})
+MERGE (c)-[:HAS_NATIONALITY]->(country)
+"""
+
+_HAS_SSN_CYPHER = """
+UNWIND range(0, size($custIds) - 1) AS i
+MATCH (c:Customer {customerId: $custIds[i]})
+MATCH (ssn:SSN {ssnNumber: $ssnNumbers[i]})
+MERGE (c)-[r:HAS_SSN]->(ssn)
+SET r.verificationDate = $baseDate,
+    r.verificationMethod = 'SYSTEM_GENERATED',
+    r.verificationStatus = 'VERIFIED'
+"""
+
+# PERFORMS and BENEFITS_TO share the Transaction endpoint, so one fused
+# query resolves the Transaction index lookup once per row and hangs
+# both edges off it; the FOREACH-over-CASE guards turn the OPTIONAL
+# MATCH misses (cash legs with no counterparty account) into no-ops.
+# CALL IN TRANSACTIONS has the server commit 10,000-row sub-batches on
+# its own, overlapping commit work with Python streaming the next batch.
+_TRANSACTION_EDGES_CYPHER = """
+UNWIND $batch AS row
+CALL {
+    WITH row
+    MATCH (t:Transaction {transactionId: row.txid})
+    OPTIONAL MATCH (a:Account {accountNumber: row.orig})
+    FOREACH (_ IN CASE WHEN a IS NULL THEN [] ELSE [1] END |
+        MERGE (a)-[:PERFORMS]->(t))
+    OPTIONAL MATCH (b:Account {accountNumber: row.bene})
+    FOREACH (_ IN CASE WHEN b IS NULL THEN [] ELSE [1] END |
+        MERGE (t)-[:BENEFITS_TO]->(b))
+} IN TRANSACTIONS OF 10000 ROWS
+"""
+
+
+def _run_batch(tx, query: str, batch: Dict, params: Dict):
+    """
+    Transaction function executing one UNWIND batch
+
+    A module-level function instead of a per-batch lambda: execute_write
+    may re-invoke it on transient-error retries, and consume() drains the
+    result inside the transaction, freeing server-side result state
+    without a second round-trip.
+    """
+    return tx.run(query, **batch, **params).consume()
+
 
 class RelationshipLoader:
     """
     Handles loading of all relationship types into Neo4j
     """
 
-    def __init__(self, driver: Driver, config: LoaderConfig):
+    def __init__(self, driver: Driver, config: LoaderConfig, session=None):
         """
         Initialize relationship loader
 
         Args:
             driver: Neo4j driver instance
             config: Loader configuration
+            session: Optional shared session to reuse instead of opening new ones
         """
         self.driver = driver
         self.config = config
+        self.session = session
         self.transformer = DataTransformer(config.base_date)
         self.stats = {}
         self.skipped = {}
+        # accounts.csv and account_mapping.csv feed four loaders each;
+        # cache the parsed rows so every file is read and parsed once
+        self._csv_cache = {}
+        # Payloads for the four account-derived relationship types, built
+        # together in one pass over accounts.csv (see
+        # _build_account_derived_batches)
+        self._account_derived = None
+        # Country codes present in the database, fetched once on first
+        # use (see _known_countries)
+        self._known_country_codes = None
+
+    def _session(self):
+        """
+        Context manager yielding the shared session if one was provided,
+        otherwise a fresh session that is closed on exit
+        """
+        if self.session is not None:
+            return nullcontext(self.session)
+        return self.driver.session(database=self.config.neo4j_database,
+                                   fetch_size=self.config.fetch_size)
+
+    def _progress(self, **kwargs) -> tqdm:
+        """
+        Progress bar with update throttling suited to bulk loads
+
+        Same settings as NodeLoader._progress: refreshes at most once a
+        second and only every batch-worth of rows, so pbar.update() stays
+        off the per-batch hot path; disabled entirely when stderr is not
+        a terminal (redirected logs would otherwise fill with partial bar
+        lines).
+        """
+        return tqdm(mininterval=1.0,
+                    miniters=max(1000, self.config.batch_size),
+                    disable=not sys.stderr.isatty(),
+                    **kwargs)
+
+    def _known_countries(self) -> frozenset:
+        """
+        Country codes that exist as Country nodes, fetched once
+
+        LOCATED_IN, IS_HOSTED and HAS_NATIONALITY all MATCH the Country
+        endpoint per row; a code with no node makes the MERGE a silent
+        no-op but still costs the server an index probe. The node-loader
+        universe is the ~20 codes in COUNTRY_CODES, so one upfront query
+        lets the loaders drop unknown codes client-side and shrink their
+        payloads instead of shipping rows the server will discard.
+
+        Returns:
+            Frozenset of Country.code values present in the database
+        """
+        if self._known_country_codes is None:
+            with self._session() as session:
+                result = session.run("MATCH (c:Country) RETURN c.code AS code")
+                self._known_country_codes = frozenset(record["code"] for record in result)
+            logger.info("Cached %s known country codes", len(self._known_country_codes))
+        return self._known_country_codes
+
+    def _count_filtered_countries(self, rel_type: str, count: int):
+        """
+        Record rows dropped because their country code has no Country node
+        """
+        if count > 0:
+            logger.warning("Skipped %s %s relationships (country code not loaded)",
+                           count, rel_type)
+            self.skipped[rel_type] = self.skipped.get(rel_type, 0) + count
+
+    def iter_csv(self, csv_key: str) -> Iterator[Dict]:
+        """
+        Stream CSV rows as dictionaries, bypassing the cache
+
+        For single-pass consumers of large files (transactions.csv); the
+        rows are never all in memory at once.
+
+        Args:
+            csv_key: Key from conf.json output section
+
+        Yields:
+            One dictionary per row
+        """
+        yield from iter_csv_rows(self.config.get_csv_path(csv_key))
 
     def load_csv(self, csv_key: str) -> List[Dict]:
         """
         Load CSV file and return list of row dictionaries
 
+        Results are cached per csv_key, so loaders sharing a source file
+        (accounts, account_mapping) parse it only once. Callers must not
+        mutate the returned rows.
+
         Args:
             csv_key: Key from conf.json output section
 
         Returns:
             List of dictionaries (one per row)
         """
-        filepath = self.config.get_csv_path(csv_key)
+        if csv_key in self._csv_cache:
+            return self._csv_cache[csv_key]
 
-        if not os.path.exists(filepath):
-            logger.warning(f"CSV file not found: {filepath}")
-            return []
+        rows = list(iter_csv_rows(self.config.get_csv_path(csv_key)))
 
-        rows = []
-        with open(filepath, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-
-        logger.info(f"Loaded {len(rows):,} rows from {csv_key}")
+        logger.info("Loaded %s rows from %s", f"{len(rows):,}", csv_key)
+        self._csv_cache[csv_key] = rows
         return rows
 
-    def batch_execute(self, query: str, data: List[Dict], desc: str = "Processing"):
+    def batch_execute(self, query: str, columns: Dict[str, List], desc: str = "Processing",
+                      params: Dict = None):
         """
-        Execute query in batches using UNWIND pattern
+        Execute query in batches over parallel column lists
+
+        Payloads are structure-of-arrays: one parameter per field, each a
+        list the query indexes positionally via UNWIND range(...). Compared
+        to a list of per-row dicts this transmits field names once per
+        batch instead of once per row and cuts Python object count by
+        roughly the field count.
+
+        Up to neo4j.concurrent_batches batches are kept in flight on
+        separate sessions. Relationship MERGEs lock their endpoint nodes,
+        so concurrent batches can collide on hot accounts; writes stay in
+        execute_write, whose managed transactions retry transient errors
+        such as deadlocks and lock timeouts.
 
         Args:
-            query: Cypher query with $batch parameter
-            data: List of parameter dictionaries
+            query: Cypher query indexing the column parameters
+            columns: Equal-length column lists keyed by parameter name
             desc: Description for progress bar
+            params: Extra query parameters sent once per batch; values
+                invariant across rows (e.g. the base date) belong here
+                rather than repeated inside every row
         """
-        if not data:
-            logger.info(f"{desc}: No data to process")
+        params = params or {}
+
+        total_rows = len(next(iter(columns.values()))) if columns else 0
+        if total_rows == 0:
+            logger.info("%s: No data to process", desc)
             return
 
-        total_rows = len(data)
-        logger.info(f"{desc}: {total_rows:,} rows")
+        logger.info("%s: %s rows", desc, f"{total_rows:,}")
+
+        batch_size = self.config.batch_size
+        batches = [
+            {name: column[i:i + batch_size] for name, column in columns.items()}
+            for i in range(0, total_rows, batch_size)
+        ]
+        workers = min(self.config.concurrent_batches, len(batches))
+
+        if workers <= 1:
+            with self._session() as session:
+                with self._progress(total=total_rows, desc=desc) as pbar:
+                    for i, batch in enumerate(batches):
+                        try:
+                            session.execute_write(_run_batch, query, batch, params)
+                            pbar.update(len(next(iter(batch.values()))))
+                        except Exception as e:
+                            logger.error("Batch execution failed at row %s: %s", i * batch_size, e)
+                            raise
+            return
 
-        with self.driver.session() as session:
-            with tqdm(total=total_rows, desc=desc) as pbar:
-                for i in range(0, total_rows, self.config.batch_size):
-                    batch = data[i:i + self.config.batch_size]
+        def run_batch(batch):
+            with self.driver.session(database=self.config.neo4j_database,
+                                     fetch_size=self.config.fetch_size) as session:
+                session.execute_write(_run_batch, query, batch, params)
+                return len(next(iter(batch.values())))
+
+        with self._progress(total=total_rows, desc=desc) as pbar:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(run_batch, batch) for batch in batches]
+                for future in as_completed(futures):
                     try:
-                        session.execute_write(lambda tx: tx.run(query, batch=batch))
+                        pbar.update(future.result())
+                    except Exception as e:
+                        logger.error("Batch execution failed: %s", e)
+                        raise
+
+    def batch_execute_iter(self, query: str, rows: Iterator[Dict], desc: str = "Processing") -> int:
+        """
+        Execute query in batches from a row iterator (UNWIND pattern)
+
+        Unlike batch_execute, this keeps memory at O(batch_size): rows are
+        accumulated into one batch at a time and flushed as they stream in.
+
+        Queries passed here may use CALL { ... } IN TRANSACTIONS to let the
+        server commit sub-batches on its own, so each batch runs as an
+        implicit auto-commit transaction (session.run) rather than inside
+        execute_write - Cypher forbids IN TRANSACTIONS inside an explicit
+        transaction.
+
+        Args:
+            query: Cypher query with $batch parameter
+            rows: Iterable of parameter dictionaries
+            desc: Description for progress bar
+
+        Returns:
+            Number of rows written
+        """
+        batch_size = self.config.batch_size
+        total = 0
+        batch = []
+
+        with self._session() as session:
+            with self._progress(desc=desc, unit="rows") as pbar:
+                for row in rows:
+                    batch.append(row)
+                    if len(batch) >= batch_size:
+                        try:
+                            session.run(query, batch=batch).consume()
+                        except Exception as e:
+                            logger.error("Batch execution failed at row %s: %s", total, e)
+                            raise
+                        total += len(batch)
                         pbar.update(len(batch))
+                        batch = []
+
+                if batch:
+                    try:
+                        session.run(query, batch=batch).consume()
                     except Exception as e:
-                        logger.error(f"Batch execution failed at row {i}: {e}")
+                        logger.error("Batch execution failed at row %s: %s", total, e)
                         raise
+                    total += len(batch)
+                    pbar.update(len(batch))
+
+        if total == 0:
+            logger.info("%s: No data to process", desc)
+
+        return total
 
     def load_has_account_relationships(self):
         """
@@ -97,44 +371,53 @@ class RelationshipLoader:
         if not mappings:
             return
 
-        relationships = []
+        cust_ids = []
+        acct_nums = []
+        roles = []
+        # role is almost always 'Primary'; interning collapses the per-row
+        # copies from the CSV parser to one shared object per distinct value
+        intern = sys.intern
         for row in mappings:
             acct_id = row.get('acct_id', '').strip()
             cust_id = row.get('cust_id', '').strip()
 
             if acct_id and cust_id:
-                relationships.append({
-                    "custId": cust_id,
-                    "acctNum": acct_id,
-                    "role": row.get('cust_acct_role', 'Primary'),
-                    "since": self.config.base_date.isoformat()
-                })
-
-        query = """
-        UNWIND $batch AS row
-        MATCH (c:Customer {customerId: row.custId})
-        MATCH (a:Account {accountNumber: row.acctNum})
-        MERGE (c)-[r:HAS_ACCOUNT]->(a)
-        SET r.role = row.role,
-            r.since = datetime(row.since)
-        """
-
-        self.batch_execute(query, relationships, "Loading HAS_ACCOUNT relationships")
-        self.stats["HAS_ACCOUNT"] = len(relationships)
-        logger.info(f"Loaded {len(relationships)} HAS_ACCOUNT relationships")
+                cust_ids.append(cust_id)
+                acct_nums.append(acct_id)
+                roles.append(intern(row.get('cust_acct_role', 'Primary')))
+
+        # since is invariant across rows, so it travels once per batch as
+        # a native temporal parameter instead of ~30 bytes in every row
+        self.batch_execute(_HAS_ACCOUNT_CYPHER,
+                           {"custIds": cust_ids, "acctNums": acct_nums, "roles": roles},
+                           "Loading HAS_ACCOUNT relationships",
+                           params={"baseDate": DateTime.from_native(self.config.base_date)})
+        self.stats["HAS_ACCOUNT"] = len(cust_ids)
+        logger.info("Loaded %s HAS_ACCOUNT relationships", len(cust_ids))
+
+    def _build_account_derived_batches(self) -> Dict[str, Dict[str, List]]:
+        """
+        Build the four account-derived relationship payloads in one pass
+
+        HAS_ADDRESS, LOCATED_IN, IS_HOSTED and HAS_SSN all project out of
+        accounts.csv (plus the account→customer mapping). Iterating the
+        cached rows once and appending to per-field column lists cuts the
+        iteration and field-extraction cost to a quarter of the
+        one-pass-per-loader version - same work, one sweep over memory -
+        and the columns feed batch_execute directly as
+        structure-of-arrays payloads. Address hashes are computed with one
+        batch call over the columnized address fields.
 
-    def load_has_address_relationships(self):
-        """
-        Load HAS_ADDRESS relationships (Customer→Address) from accounts.csv
+        Returns:
+            Column dicts keyed by relationship type; built on first call
+            and cached for the remaining loaders
         """
-        logger.info("Loading HAS_ADDRESS relationships...")
+        if self._account_derived is not None:
+            return self._account_derived
 
         accounts = self.load_csv('accounts')
         mappings = self.load_csv('account_mapping')
 
-        if not accounts or not mappings:
-            return
-
         # Build account -> customer mapping
         acct_to_cust = {}
         for row in mappings:
@@ -143,44 +426,109 @@ class RelationshipLoader:
             if acct_id and cust_id:
                 acct_to_cust[acct_id] = cust_id
 
-        relationships = []
+        known_countries = self._known_countries()
+
+        hosted_acct_nums = []
+        hosted_countries = []
+        hosted_filtered = 0
+        ssn_cust_ids = []
+        ssn_numbers = []
+        ssn_seen = set()  # Deduplicate customer→SSN pairs
+
+        # Address fields are columnized during the sweep and hashed with
+        # one batch call afterwards; the parallel cust_id/country columns
+        # carry the per-row context the address payloads need
+        addr_cust_ids = []
+        addr_countries = []
+        streets = []
+        cities = []
+        postcodes = []
+
+        # Country codes have well under 250 distinct values across millions
+        # of rows; interning makes each column hold one shared object per
+        # distinct code instead of a fresh str per row
+        intern = sys.intern
+
         for row in accounts:
             acct_id = row.get('acct_id', '').strip()
+            country = intern(row.get('country', 'US').strip())
             cust_id = acct_to_cust.get(acct_id)
 
-            if not cust_id:
-                continue
+            if acct_id:
+                if country in known_countries:
+                    hosted_acct_nums.append(acct_id)
+                    hosted_countries.append(country)
+                else:
+                    hosted_filtered += 1
 
             street = row.get('street_addr', '').strip()
             city = row.get('city', '').strip()
             postcode = row.get('zip', '').strip()
 
-            if not (street and city and postcode):
-                continue
+            if street and city and postcode:
+                addr_cust_ids.append(cust_id)
+                addr_countries.append(country)
+                streets.append(street)
+                cities.append(city)
+                postcodes.append(postcode)
 
-            addr_hash = self.transformer.normalize_address_key(street, city, postcode)
+            ssn = row.get('ssn', '').strip()
+            if cust_id and ssn:
+                key = (cust_id, ssn)
+                if key not in ssn_seen:
+                    ssn_seen.add(key)
+                    ssn_cust_ids.append(cust_id)
+                    ssn_numbers.append(ssn)
+
+        addr_hashes = self.transformer.normalize_address_keys_batch(streets, cities, postcodes)
+
+        # Payload columns carry only the varying fields; invariants (the
+        # base date, verification constants, isCurrent) live in the
+        # queries or travel once per batch as parameters
+        has_addr_cust_ids = []
+        has_addr_hashes = []
+        for cust_id, addr_hash in zip(addr_cust_ids, addr_hashes):
+            if cust_id:
+                has_addr_cust_ids.append(cust_id)
+                has_addr_hashes.append(addr_hash)
+
+        # Address → Country, deduplicated on the hash and filtered to
+        # codes that have a Country node
+        address_map = {}
+        located_in_filtered = 0
+        for addr_hash, country in zip(addr_hashes, addr_countries):
+            if country not in known_countries:
+                located_in_filtered += 1
+            elif addr_hash not in address_map:
+                address_map[addr_hash] = country
 
-            relationships.append({
-                "custId": cust_id,
-                "addressHash": addr_hash,
-                "addedAt": self.config.base_date.isoformat(),
-                "lastChangedAt": self.config.base_date.isoformat(),
-                "isCurrent": True
-            })
+        self._count_filtered_countries("IS_HOSTED", hosted_filtered)
+        self._count_filtered_countries("LOCATED_IN", located_in_filtered)
+
+        self._account_derived = {
+            "HAS_ADDRESS": {"custIds": has_addr_cust_ids,
+                            "addressHashes": has_addr_hashes},
+            "LOCATED_IN": {"addressHashes": list(address_map.keys()),
+                           "countryCodes": list(address_map.values())},
+            "IS_HOSTED": {"accountNumbers": hosted_acct_nums,
+                          "countryCodes": hosted_countries},
+            "HAS_SSN": {"custIds": ssn_cust_ids,
+                        "ssnNumbers": ssn_numbers},
+        }
+        return self._account_derived
 
-        query = """
-        UNWIND $batch AS row
-        MATCH (c:Customer {customerId: row.custId})
-        MATCH (addr:Address {addressHash: row.addressHash})
-        MERGE (c)-[r:HAS_ADDRESS]->(addr)
-        SET r.addedAt = datetime(row.addedAt),
-            r.lastChangedAt = datetime(row.lastChangedAt),
-            r.isCurrent = row.isCurrent
+    def load_has_address_relationships(self):
+        """
+        Load HAS_ADDRESS relationships (Customer→Address) from accounts.csv
         """
+        logger.info("Loading HAS_ADDRESS relationships...")
+
+        columns = self._build_account_derived_batches()["HAS_ADDRESS"]
 
-        self.batch_execute(query, relationships, "Loading HAS_ADDRESS relationships")
-        self.stats["HAS_ADDRESS"] = len(relationships)
-        logger.info(f"Loaded {len(relationships)} HAS_ADDRESS relationships")
+        self.batch_execute(_HAS_ADDRESS_CYPHER, columns, "Loading HAS_ADDRESS relationships",
+                           params={"baseDate": DateTime.from_native(self.config.base_date)})
+        self.stats["HAS_ADDRESS"] = len(columns["custIds"])
+        logger.info("Loaded %s HAS_ADDRESS relationships", self.stats["HAS_ADDRESS"])
 
     def load_located_in_relationships(self):
         """
@@ -188,41 +536,11 @@ class RelationshipLoader:
         """
         logger.info("Loading LOCATED_IN relationships...")
 
-        accounts = self.load_csv('accounts')
-        if not accounts:
-            return
+        columns = self._build_account_derived_batches()["LOCATED_IN"]
 
-        # Address → Country
-        address_map = {}
-        for row in accounts:
-            street = row.get('street_addr', '').strip()
-            city = row.get('city', '').strip()
-            postcode = row.get('zip', '').strip()
-            country = row.get('country', 'US').strip()
-
-            if not (street and city and postcode):
-                continue
-
-            addr_hash = self.transformer.normalize_address_key(street, city, postcode)
-
-            if addr_hash not in address_map:
-                address_map[addr_hash] = country
-
-        address_country_rels = [
-            {"addressHash": addr_hash, "countryCode": country}
-            for addr_hash, country in address_map.items()
-        ]
-
-        query = """
-        UNWIND $batch AS row
-        MATCH (addr:Address {addressHash: row.addressHash})
-        MATCH (c:Country {code: row.countryCode})
-        MERGE (addr)-[:LOCATED_IN]->(c)
-        """
-
-        self.batch_execute(query, address_country_rels, "Loading Address→Country LOCATED_IN")
-        self.stats["LOCATED_IN"] = len(address_country_rels)
-        logger.info(f"Loaded {len(address_country_rels)} LOCATED_IN relationships")
+        self.batch_execute(_LOCATED_IN_CYPHER, columns, "Loading Address→Country LOCATED_IN")
+        self.stats["LOCATED_IN"] = len(columns["addressHashes"])
+        logger.info("Loaded %s LOCATED_IN relationships", self.stats["LOCATED_IN"])
 
     def load_is_hosted_relationships(self):
         """
@@ -230,31 +548,11 @@ class RelationshipLoader:
         """
         logger.info("Loading IS_HOSTED relationships...")
 
-        accounts = self.load_csv('accounts')
-        if not accounts:
-            return
-
-        relationships = []
-        for row in accounts:
-            acct_id = row.get('acct_id', '').strip()
-            country = row.get('country', 'US').strip()
-
-            if acct_id:
-                relationships.append({
-                    "accountNumber": acct_id,
-                    "countryCode": country
-                })
-
-        query = """
-        UNWIND $batch AS row
-        MATCH (a:Account {accountNumber: row.accountNumber})
-        MATCH (c:Country {code: row.countryCode})
-        MERGE (a)-[:IS_HOSTED]->(c)
-        """
+        columns = self._build_account_derived_batches()["IS_HOSTED"]
 
-        self.batch_execute(query, relationships, "Loading Account→Country IS_HOSTED")
-        self.stats["IS_HOSTED"] = len(relationships)
-        logger.info(f"Loaded {len(relationships)} IS_HOSTED relationships")
+        self.batch_execute(_IS_HOSTED_CYPHER, columns, "Loading Account→Country IS_HOSTED")
+        self.stats["IS_HOSTED"] = len(columns["accountNumbers"])
+        logger.info("Loaded %s IS_HOSTED relationships", self.stats["IS_HOSTED"])
 
     def load_has_nationality_relationships(self):
         """
@@ -266,27 +564,29 @@ class RelationshipLoader:
         if not individuals:
             return
 
-        relationships = []
+        known_countries = self._known_countries()
+        cust_ids = []
+        country_codes = []
+        filtered = 0
+        intern = sys.intern
         for row in individuals:
             party_id = row.get('partyId', '').strip()
             nationality = row.get('nationality', 'US').strip()
 
             if party_id and nationality:
-                relationships.append({
-                    "custId": party_id,
-                    "countryCode": nationality
-                })
+                if nationality in known_countries:
+                    cust_ids.append(party_id)
+                    country_codes.append(intern(nationality))
+                else:
+                    filtered += 1
 
-        query = """
-        UNWIND $batch AS row
-        MATCH (c:Customer {customerId: row.custId})
-        MATCH (country:Country {code: row.countryCode})
-        MERGE (c)-[:HAS_NATIONALITY]->(country)
-        """
+        self._count_filtered_countries("HAS_NATIONALITY", filtered)
 
-        self.batch_execute(query, relationships, "Loading HAS_NATIONALITY relationships")
-        self.stats["HAS_NATIONALITY"] = len(relationships)
-        logger.info(f"Loaded {len(relationships)} HAS_NATIONALITY relationships")
+        self.batch_execute(_HAS_NATIONALITY_CYPHER,
+                           {"custIds": cust_ids, "countryCodes": country_codes},
+                           "Loading HAS_NATIONALITY relationships")
+        self.stats["HAS_NATIONALITY"] = len(cust_ids)
+        logger.info("Loaded %s HAS_NATIONALITY relationships", len(cust_ids))
 
     def load_has_ssn_relationships(self):
         """
@@ -294,13 +594,105 @@ class RelationshipLoader:
         """
         logger.info("Loading HAS_SSN relationships...")
 
+        columns = self._build_account_derived_batches()["HAS_SSN"]
+
+        self.batch_execute(_HAS_SSN_CYPHER, columns, "Loading HAS_SSN relationships",
+                           params={"baseDate": DateTime.from_native(self.config.base_date)})
+        self.stats["HAS_SSN"] = len(columns["custIds"])
+        logger.info("Loaded %s HAS_SSN relationships", self.stats["HAS_SSN"])
+
+    def load_transaction_edges(self):
+        """
+        Load PERFORMS and BENEFITS_TO relationships in one transactions pass
+
+        Both edge types key off the same Transaction node, so a single
+        streaming pass over transactions.csv with the fused query halves
+        both the CSV I/O and the per-row Transaction index lookups versus
+        loading them separately. Legs with a missing account (cash
+        deposits/withdrawals) travel as nulls and are skipped server-side
+        by the FOREACH guards. transactions.csv is the largest file and
+        never needs to be materialized here.
+        """
+        logger.info("Loading PERFORMS and BENEFITS_TO relationships...")
+
+        counts = {"PERFORMS": 0, "BENEFITS_TO": 0,
+                  "skipped_performs": 0, "skipped_benefits": 0}
+
+        def relationship_rows():
+            for row in self.iter_csv('transactions'):
+                tx_id = row.get('tran_id', '').strip()
+                orig_acct = row.get('orig_acct', '').strip()
+                bene_acct = row.get('bene_acct', '').strip()
+
+                if not tx_id:
+                    counts["skipped_performs"] += 1
+                    counts["skipped_benefits"] += 1
+                    continue
+
+                if orig_acct:
+                    counts["PERFORMS"] += 1
+                else:
+                    counts["skipped_performs"] += 1
+                if bene_acct:
+                    counts["BENEFITS_TO"] += 1
+                else:
+                    counts["skipped_benefits"] += 1
+
+                yield {"txid": tx_id,
+                       "orig": orig_acct or None,
+                       "bene": bene_acct or None}
+
+        self.batch_execute_iter(_TRANSACTION_EDGES_CYPHER, relationship_rows(),
+                                "Loading transaction relationships")
+        self.stats["PERFORMS"] = counts["PERFORMS"]
+        self.stats["BENEFITS_TO"] = counts["BENEFITS_TO"]
+
+        if counts["skipped_performs"] > 0:
+            logger.warning("Skipped %s PERFORMS relationships (missing orig_acct - likely cash transactions)",
+                           counts["skipped_performs"])
+            self.skipped["PERFORMS"] = counts["skipped_performs"]
+        if counts["skipped_benefits"] > 0:
+            logger.warning("Skipped %s BENEFITS_TO relationships (missing bene_acct - likely cash transactions)",
+                           counts["skipped_benefits"])
+            self.skipped["BENEFITS_TO"] = counts["skipped_benefits"]
+
+        logger.info("Loaded %s PERFORMS and %s BENEFITS_TO relationships",
+                    counts["PERFORMS"], counts["BENEFITS_TO"])
+
+    def emit_admin_import_csvs(self, staging_dir: str) -> List[str]:
+        """
+        Stage relationship CSVs for neo4j-admin database import
+
+        Writes one header+data CSV per relationship type with admin-import
+        headers (:START_ID(Customer), :END_ID(Account), :TYPE, property
+        columns). The row-building logic mirrors the UNWIND loaders above
+        - including the normalize_address_key hashes used as Address
+        :END_ID values - so the bulk path produces the same graph; it just
+        skips Bolt and the transaction log. The PERFORMS and BENEFITS_TO
+        files are staged in a single streaming pass over transactions.csv.
+
+        Args:
+            staging_dir: Directory receiving the staged CSV files
+
+        Returns:
+            Paths of the staged files, one per --relationships= argument
+        """
+        logger.info("Staging relationship CSVs for neo4j-admin import in %s", staging_dir)
+
         accounts = self.load_csv('accounts')
         mappings = self.load_csv('account_mapping')
+        individuals = self.load_csv('party_individuals')
+        base_iso = self.config.base_date.isoformat()
+        normalize_address_key = self.transformer.normalize_address_key
+        paths = []
 
-        if not accounts or not mappings:
-            return
+        def emit(filename, header, rows):
+            path = os.path.join(staging_dir, filename)
+            count = write_staging_csv(path, header, rows)
+            paths.append(path)
+            return count
 
-        # Build account -> customer mapping
+        # Account → customer mapping feeds HAS_ACCOUNT, HAS_ADDRESS and HAS_SSN
         acct_to_cust = {}
         for row in mappings:
             acct_id = row.get('acct_id', '').strip()
@@ -308,129 +700,150 @@ class RelationshipLoader:
             if acct_id and cust_id:
                 acct_to_cust[acct_id] = cust_id
 
-        relationships = []
-        seen = set()  # Deduplicate customer→SSN pairs
+        has_account_rows = []
+        for row in mappings:
+            acct_id = row.get('acct_id', '').strip()
+            cust_id = row.get('cust_id', '').strip()
+            if acct_id and cust_id:
+                has_account_rows.append([cust_id, acct_id, 'HAS_ACCOUNT',
+                                         row.get('cust_acct_role', 'Primary'), base_iso])
+
+        self.stats["HAS_ACCOUNT"] = emit(
+            'rels_has_account.csv',
+            [':START_ID(Customer)', ':END_ID(Account)', ':TYPE', 'role', 'since:datetime'],
+            has_account_rows)
+
+        # HAS_ADDRESS, LOCATED_IN, IS_HOSTED and HAS_SSN all derive from
+        # accounts.csv; one pass fills all four staging files
+        has_address_rows = []
+        located_in_map = {}
+        is_hosted_rows = []
+        has_ssn_rows = []
+        ssn_seen = set()
 
         for row in accounts:
             acct_id = row.get('acct_id', '').strip()
-            ssn = row.get('ssn', '').strip()
+            country = row.get('country', 'US').strip()
             cust_id = acct_to_cust.get(acct_id)
 
-            if cust_id and ssn:
-                key = (cust_id, ssn)
-                if key not in seen:
-                    seen.add(key)
-                    relationships.append({
-                        "custId": cust_id,
-                        "ssnNumber": ssn,
-                        "verificationDate": self.config.base_date.isoformat(),
-                        "verificationMethod": "SYSTEM_GENERATED",
-                        "verificationStatus": "VERIFIED"
-                    })
-
-        query = """
-        UNWIND $batch AS row
-        MATCH (c:Customer {customerId: row.custId})
-        MATCH (ssn:SSN {ssnNumber: row.ssnNumber})
-        MERGE (c)-[r:HAS_SSN]->(ssn)
-        SET r.verificationDate = datetime(row.verificationDate),
-            r.verificationMethod = row.verificationMethod,
-            r.verificationStatus = row.verificationStatus
-        """
-
-        self.batch_execute(query, relationships, "Loading HAS_SSN relationships")
-        self.stats["HAS_SSN"] = len(relationships)
-        logger.info(f"Loaded {len(relationships)} HAS_SSN relationships")
-
-    def load_performs_relationships(self):
-        """
-        Load PERFORMS relationships (Account→Transaction)
-        """
-        logger.info("Loading PERFORMS relationships...")
-
-        transactions = self.load_csv('transactions')
-        if not transactions:
-            return
-
-        relationships = []
-        skipped = 0
-
-        for row in transactions:
-            tx_id = row.get('tran_id', '').strip()
-            orig_acct = row.get('orig_acct', '').strip()
-
-            if tx_id and orig_acct:
-                relationships.append({
-                    "accountNumber": orig_acct,
-                    "transactionId": tx_id
-                })
-            else:
-                skipped += 1
-
-        query = """
-        UNWIND $batch AS row
-        MATCH (a:Account {accountNumber: row.accountNumber})
-        MATCH (t:Transaction {transactionId: row.transactionId})
-        MERGE (a)-[:PERFORMS]->(t)
-        """
-
-        self.batch_execute(query, relationships, "Loading PERFORMS relationships")
-        self.stats["PERFORMS"] = len(relationships)
-
-        if skipped > 0:
-            logger.warning(f"Skipped {skipped} PERFORMS relationships (missing orig_acct - likely cash transactions)")
-            self.skipped["PERFORMS"] = skipped
-
-        logger.info(f"Loaded {len(relationships)} PERFORMS relationships")
-
-    def load_benefits_to_relationships(self):
-        """
-        Load BENEFITS_TO relationships (Transaction→Account)
-        """
-        logger.info("Loading BENEFITS_TO relationships...")
-
-        transactions = self.load_csv('transactions')
-        if not transactions:
-            return
-
-        relationships = []
-        skipped = 0
-
-        for row in transactions:
-            tx_id = row.get('tran_id', '').strip()
-            bene_acct = row.get('bene_acct', '').strip()
-
-            if tx_id and bene_acct:
-                relationships.append({
-                    "transactionId": tx_id,
-                    "accountNumber": bene_acct
-                })
-            else:
-                skipped += 1
-
-        query = """
-        UNWIND $batch AS row
-        MATCH (t:Transaction {transactionId: row.transactionId})
-        MATCH (a:Account {accountNumber: row.accountNumber})
-        MERGE (t)-[:BENEFITS_TO]->(a)
-        """
+            if acct_id:
+                is_hosted_rows.append([acct_id, country, 'IS_HOSTED'])
 
-        self.batch_execute(query, relationships, "Loading BENEFITS_TO relationships")
-        self.stats["BENEFITS_TO"] = len(relationships)
+            street = row.get('street_addr', '').strip()
+            city = row.get('city', '').strip()
+            postcode = row.get('zip', '').strip()
 
-        if skipped > 0:
-            logger.warning(f"Skipped {skipped} BENEFITS_TO relationships (missing bene_acct - likely cash transactions)")
-            self.skipped["BENEFITS_TO"] = skipped
+            if street and city and postcode:
+                addr_hash = normalize_address_key(street, city, postcode)
+                if addr_hash not in located_in_map:
+                    located_in_map[addr_hash] = country
+                if cust_id:
+                    has_address_rows.append([cust_id, addr_hash, 'HAS_ADDRESS',
+                                             base_iso, base_iso, 'true'])
 
-        logger.info(f"Loaded {len(relationships)} BENEFITS_TO relationships")
+            ssn = row.get('ssn', '').strip()
+            if cust_id and ssn:
+                key = (cust_id, ssn)
+                if key not in ssn_seen:
+                    ssn_seen.add(key)
+                    has_ssn_rows.append([cust_id, ssn, 'HAS_SSN', base_iso,
+                                         'SYSTEM_GENERATED', 'VERIFIED'])
+
+        self.stats["HAS_ADDRESS"] = emit(
+            'rels_has_address.csv',
+            [':START_ID(Customer)', ':END_ID(Address)', ':TYPE',
+             'addedAt:datetime', 'lastChangedAt:datetime', 'isCurrent:boolean'],
+            has_address_rows)
+
+        self.stats["LOCATED_IN"] = emit(
+            'rels_located_in.csv',
+            [':START_ID(Address)', ':END_ID(Country)', ':TYPE'],
+            ([addr_hash, country, 'LOCATED_IN']
+             for addr_hash, country in located_in_map.items()))
+
+        self.stats["IS_HOSTED"] = emit(
+            'rels_is_hosted.csv',
+            [':START_ID(Account)', ':END_ID(Country)', ':TYPE'],
+            is_hosted_rows)
+
+        has_nationality_rows = []
+        for row in individuals:
+            party_id = row.get('partyId', '').strip()
+            nationality = row.get('nationality', 'US').strip()
+            if party_id and nationality:
+                has_nationality_rows.append([party_id, nationality, 'HAS_NATIONALITY'])
+
+        self.stats["HAS_NATIONALITY"] = emit(
+            'rels_has_nationality.csv',
+            [':START_ID(Customer)', ':END_ID(Country)', ':TYPE'],
+            has_nationality_rows)
+
+        self.stats["HAS_SSN"] = emit(
+            'rels_has_ssn.csv',
+            [':START_ID(Customer)', ':END_ID(SSN)', ':TYPE', 'verificationDate:datetime',
+             'verificationMethod', 'verificationStatus'],
+            has_ssn_rows)
+
+        # PERFORMS and BENEFITS_TO stream from transactions.csv in one
+        # pass, writing both staging files side by side
+        performs_path = os.path.join(staging_dir, 'rels_performs.csv')
+        benefits_path = os.path.join(staging_dir, 'rels_benefits_to.csv')
+        performs_count = 0
+        benefits_count = 0
+        skipped_performs = 0
+        skipped_benefits = 0
+
+        with open(performs_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as pf, \
+                open(benefits_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as bf:
+            performs_writer = csv.writer(pf)
+            benefits_writer = csv.writer(bf)
+            performs_writer.writerow([':START_ID(Account)', ':END_ID(Transaction)', ':TYPE'])
+            benefits_writer.writerow([':START_ID(Transaction)', ':END_ID(Account)', ':TYPE'])
+
+            for row in self.iter_csv('transactions'):
+                tx_id = row.get('tran_id', '').strip()
+                if not tx_id:
+                    skipped_performs += 1
+                    skipped_benefits += 1
+                    continue
+                orig_acct = row.get('orig_acct', '').strip()
+                bene_acct = row.get('bene_acct', '').strip()
+                if orig_acct:
+                    performs_writer.writerow([orig_acct, tx_id, 'PERFORMS'])
+                    performs_count += 1
+                else:
+                    skipped_performs += 1
+                if bene_acct:
+                    benefits_writer.writerow([tx_id, bene_acct, 'BENEFITS_TO'])
+                    benefits_count += 1
+                else:
+                    skipped_benefits += 1
+
+        paths.extend([performs_path, benefits_path])
+        self.stats["PERFORMS"] = performs_count
+        self.stats["BENEFITS_TO"] = benefits_count
+        if skipped_performs:
+            self.skipped["PERFORMS"] = skipped_performs
+        if skipped_benefits:
+            self.skipped["BENEFITS_TO"] = skipped_benefits
+        logger.info("Staged %s PERFORMS and %s BENEFITS_TO rows",
+                    f"{performs_count:,}", f"{benefits_count:,}")
+
+        logger.info("Staged %s relationship CSV files", len(paths))
+        return paths
 
     def load_all_relationships(self):
         """
         Load all relationship types in correct order
+
+        The relationship types run sequentially relative to each other;
+        within each load, batch_execute dispatches batches concurrently
+        and relies on managed-transaction retries to absorb endpoint-lock
+        conflicts.
         """
-        logger.info("\n" + "=" * 60)
+        logger.info("\n%s", _BANNER)
         logger.info("Loading Relationships")
-        logger.info("=" * 60)
+        logger.info(_BANNER)
 
         self.load_has_account_relationships()
         self.load_has_address_relationships()
@@ -438,8 +851,7 @@ class RelationshipLoader:
         self.load_is_hosted_relationships()
         self.load_has_nationality_relationships()
         self.load_has_ssn_relationships()
-        self.load_performs_relationships()
-        self.load_benefits_to_relationships()
+        self.load_transaction_edges()
 
         logger.info("\nRelationship loading complete")
         return self.stats, self.skipped
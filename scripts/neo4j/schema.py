@@ -2,6 +2,9 @@
 Neo4j schema creation: constraints and indexes
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+
 from neo4j import Driver
 import logging
 
@@ -13,14 +16,58 @@ class SchemaManager:
     Manages Neo4j schema creation (constraints and indexes)
     """
 
-    def __init__(self, driver: Driver):
+    def __init__(self, driver: Driver, session=None, database=None):
         """
         Initialize schema manager
 
         Args:
             driver: Neo4j driver instance
+            session: Optional shared session to reuse instead of opening new ones
+            database: Target database name for sessions opened here; omitting
+                it costs the driver an extra routing round-trip per session
         """
         self.driver = driver
+        self.session = session
+        self.database = database
+        self._schema_ready = False
+
+    def _session(self):
+        """
+        Context manager yielding the shared session if one was provided,
+        otherwise a fresh session that is closed on exit
+        """
+        if self.session is not None:
+            return nullcontext(self.session)
+        return self.driver.session(database=self.database)
+
+    def _run_ddl_statements(self, statements, kind: str):
+        """
+        Dispatch idempotent DDL statements over concurrent sessions
+
+        Each statement is IF NOT EXISTS and independent of the others, so
+        they are submitted in parallel (one session per worker - sessions
+        are not thread-safe, the driver is). Neo4j serializes the schema
+        writes internally, but index population starts as soon as each
+        statement lands, so the builds overlap instead of queueing behind
+        a serial dispatch loop.
+
+        Args:
+            statements: DDL statements to run
+            kind: 'constraint' or 'index', for log messages
+        """
+        def run_statement(statement):
+            with self.driver.session(database=self.database) as session:
+                session.run(statement).consume()
+
+        with ThreadPoolExecutor(max_workers=min(8, len(statements))) as executor:
+            futures = {executor.submit(run_statement, stmt): stmt for stmt in statements}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    logger.debug("Created %s: %s", kind, futures[future])
+                except Exception as e:
+                    logger.warning("%s creation failed (may already exist): %s",
+                                   kind.capitalize(), e)
 
     def create_constraints(self):
         """
@@ -40,13 +87,7 @@ class SchemaManager:
             "CREATE CONSTRAINT ssn_number IF NOT EXISTS FOR (s:SSN) REQUIRE s.ssnNumber IS NODE KEY",
         ]
 
-        with self.driver.session() as session:
-            for constraint_query in constraints:
-                try:
-                    session.run(constraint_query)
-                    logger.debug(f"Created constraint: {constraint_query}")
-                except Exception as e:
-                    logger.warning(f"Constraint creation failed (may already exist): {e}")
+        self._run_ddl_statements(constraints, "constraint")
 
         logger.info("Constraints created successfully")
 
@@ -77,13 +118,7 @@ class SchemaManager:
             "CREATE INDEX account_bank_idx IF NOT EXISTS FOR (a:Account) ON (a.bank_id)",
         ]
 
-        with self.driver.session() as session:
-            for index_query in indexes:
-                try:
-                    session.run(index_query)
-                    logger.debug(f"Created index: {index_query}")
-                except Exception as e:
-                    logger.warning(f"Index creation failed (may already exist): {e}")
+        self._run_ddl_statements(indexes, "index")
 
         logger.info("Indexes created successfully")
 
@@ -93,7 +128,7 @@ class SchemaManager:
         """
         logger.warning("Dropping all constraints...")
 
-        with self.driver.session() as session:
+        with self._session() as session:
             # Get all constraints
             result = session.run("SHOW CONSTRAINTS")
             for record in result:
@@ -101,9 +136,9 @@ class SchemaManager:
                 if constraint_name:
                     try:
                         session.run(f"DROP CONSTRAINT {constraint_name}")
-                        logger.debug(f"Dropped constraint: {constraint_name}")
+                        logger.debug("Dropped constraint: %s", constraint_name)
                     except Exception as e:
-                        logger.error(f"Failed to drop constraint {constraint_name}: {e}")
+                        logger.error("Failed to drop constraint %s: %s", constraint_name, e)
 
     def drop_all_indexes(self):
         """
@@ -111,7 +146,7 @@ class SchemaManager:
         """
         logger.warning("Dropping all indexes...")
 
-        with self.driver.session() as session:
+        with self._session() as session:
             # Get all indexes
             result = session.run("SHOW INDEXES")
             for record in result:
@@ -119,54 +154,91 @@ class SchemaManager:
                 if index_name and not index_name.startswith("constraint_"):
                     try:
                         session.run(f"DROP INDEX {index_name}")
-                        logger.debug(f"Dropped index: {index_name}")
+                        logger.debug("Dropped index: %s", index_name)
                     except Exception as e:
-                        logger.error(f"Failed to drop index {index_name}: {e}")
+                        logger.error("Failed to drop index %s: %s", index_name, e)
 
     def wait_for_indexes(self, timeout: int = 300):
         """
         Wait for all indexes to come online
 
+        Blocks on the server via db.awaitIndexes, which returns the moment
+        population finishes instead of burning up to 2 seconds of idle
+        polling per check. The SHOW INDEXES polling loop remains as a
+        fallback for servers without the procedure. Like the DDL
+        statements, the wait never fails the run: if index state cannot
+        be read at all (e.g. the bulk-imported database has not been
+        started yet), it warns and returns.
+
         Args:
             timeout: Maximum time to wait in seconds
         """
         logger.info("Waiting for indexes to populate...")
 
-        with self.driver.session() as session:
-            query = """
-            SHOW INDEXES
-            """
+        with self._session() as session:
+            try:
+                session.run("CALL db.awaitIndexes($timeout)", timeout=timeout).consume()
+                logger.info("All indexes are online")
+                return
+            except Exception as e:
+                logger.debug("db.awaitIndexes unavailable (%s); falling back to polling", e)
 
             import time
             start_time = time.time()
 
             while time.time() - start_time < timeout:
-                result = session.run(query)
-                records = list(result)
-                pending = sum(1 for r in records if r.get("state") != "ONLINE")
+                try:
+                    result = session.run("SHOW INDEXES")
+                    pending = sum(1 for r in result if r.get("state") != "ONLINE")
+                except Exception as e:
+                    # Same non-fatal treatment the DDL gets: against a
+                    # database that is not up yet (the bulk-import path
+                    # reaches here before the imported store has been
+                    # started), the wait is advisory - warn and move on
+                    # instead of failing an otherwise successful run
+                    logger.warning("Could not check index state (%s); skipping index wait", e)
+                    return
 
                 if pending == 0:
                     logger.info("All indexes are online")
                     return
 
-                logger.debug(f"Waiting for {pending} indexes to come online...")
+                logger.debug("Waiting for %s indexes to come online...", pending)
                 time.sleep(2)
 
-            logger.warning(f"Timeout waiting for indexes after {timeout} seconds")
+            logger.warning("Timeout waiting for indexes after %s seconds", timeout)
 
-    def setup_schema(self, force: bool = False):
+    def setup_schema(self, force: bool = False,
+                     create_constraints: bool = True, create_indexes: bool = True):
         """
         Complete schema setup: create constraints and indexes
 
+        Returns immediately - before opening any session - when there is
+        nothing to do, so repeated runs with schema creation disabled skip
+        the round-trips entirely.
+
         Args:
             force: If True, drop existing schema first
+            create_constraints: If False, skip constraint creation
+            create_indexes: If False, skip index creation
         """
+        if not force and not (create_constraints or create_indexes):
+            logger.info("Schema setup skipped (constraints and indexes disabled)")
+            return
+
+        if self._schema_ready and not force:
+            logger.info("Schema already set up in this run, skipping")
+            return
+
         if force:
             self.drop_all_constraints()
             self.drop_all_indexes()
 
-        self.create_constraints()
-        self.create_indexes()
-        self.wait_for_indexes()
+        if create_constraints:
+            self.create_constraints()
+        if create_indexes:
+            self.create_indexes()
+            self.wait_for_indexes()
 
+        self._schema_ready = True
         logger.info("Schema setup complete")
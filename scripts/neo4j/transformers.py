@@ -3,9 +3,14 @@ Data transformation utilities for converting AMLSim CSV data to Neo4j format
 """
 
 import hashlib
-import re
+import string
 from datetime import datetime, timedelta
-from typing import Optional, Any
+from functools import lru_cache
+from typing import List, Optional, Any, Sequence
+
+# Deletion table for address normalization, built once at import; a
+# str.translate pass is several times faster than the equivalent regex
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
 
 
 class DataTransformer:
@@ -13,6 +18,15 @@ class DataTransformer:
     Transforms AMLSim CSV data into Neo4j-compatible format
     """
 
+    # Explicit formats tried when the ISO fast path misses
+    _DATETIME_FORMATS = (
+        "%Y-%m-%dT%H:%M:%SZ",       # ISO 8601 with Z: 2017-01-01T00:00:00Z
+        "%Y-%m-%dT%H:%M:%S",        # ISO 8601: 2017-01-01T00:00:00
+        "%Y-%m-%d %H:%M:%S",        # SQL datetime: 2017-01-01 00:00:00
+        "%Y-%m-%d",                  # Date only: 2017-01-01
+        "%Y%m%d",                    # Compact: 20170101
+    )
+
     def __init__(self, base_date: datetime):
         """
         Initialize transformer with base date from conf.json
@@ -21,6 +35,16 @@ class DataTransformer:
             base_date: Simulation start date
         """
         self.base_date = base_date
+        # Timestamp columns are homogeneous within a CSV, so remember the
+        # format that matched per column (keyed by the caller's column
+        # name) and try it before the full trial loop
+        self._format_cache = {}
+        # Day offsets repeat heavily (the simulation runs for hundreds of
+        # steps while producing millions of rows), so batch conversion
+        # memoizes each distinct offset's datetime
+        self._days_cache = {}
+        # Same idea for YYYYMMDD strings, shared across batch calls
+        self._date_str_cache = {}
 
     def days_to_datetime(self, days: Any) -> Optional[datetime]:
         """
@@ -40,6 +64,45 @@ class DataTransformer:
         except (ValueError, TypeError):
             return None
 
+    def days_to_datetime_batch(self, days: Sequence[Any]) -> List[Optional[datetime]]:
+        """
+        Convert a whole column of AMLSim day offsets to DateTimes
+
+        Same semantics as calling days_to_datetime per value, but the
+        distinct offsets in a simulation number in the hundreds while the
+        rows number in the millions, so each offset's datetime is built
+        once and every repeat is a dict hit instead of an int() plus
+        timedelta construction. Consumers get real datetime objects, which
+        is what the Bolt serializer needs.
+
+        Args:
+            days: Column of day offsets (integers or strings)
+
+        Returns:
+            DateTimes (or None for invalid/'never' values), positionally
+            aligned with the input
+        """
+        cache = self._days_cache
+        base_date = self.base_date
+        out = []
+        append = out.append
+
+        for value in days:
+            try:
+                num_days = int(value)
+            except (ValueError, TypeError):
+                append(None)
+                continue
+
+            if num_days in cache:
+                append(cache[num_days])
+            else:
+                converted = None if num_days >= 1000000 else base_date + timedelta(days=num_days)
+                cache[num_days] = converted
+                append(converted)
+
+        return out
+
     def yyyymmdd_to_datetime(self, date_str: str) -> Optional[datetime]:
         """
         Convert YYYYMMDD string to DateTime
@@ -55,12 +118,64 @@ class DataTransformer:
         except (ValueError, TypeError):
             return None
 
-    def parse_datetime(self, date_str: str) -> Optional[datetime]:
+    def yyyymmdd_to_datetime_batch(self, date_strs: Sequence[str]) -> List[Optional[datetime]]:
+        """
+        Convert a whole column of YYYYMMDD strings to DateTimes
+
+        Same semantics as calling yyyymmdd_to_datetime per value. Date
+        columns in AMLSim output repeat the same handful of simulation
+        dates across millions of rows, so each distinct string is
+        strptime-parsed once (the memo persists across calls, like
+        days_to_datetime_batch) and every repeat is a dict hit - strptime
+        is ~5 µs per call, a dict probe is tens of nanoseconds.
+
+        No current loader feeds this: transaction timestamps go through
+        parse_datetime, whose format cache covers YYYYMMDD among other
+        layouts. It is here for CSV variants whose date columns are known
+        to be pure YYYYMMDD, where pinning the format beats the trial
+        loop.
+
+        Args:
+            date_strs: Column of date strings in YYYYMMDD format
+
+        Returns:
+            DateTimes (or None where parsing fails), positionally aligned
+            with the input
+        """
+        cache = self._date_str_cache
+        strptime = datetime.strptime
+        out = []
+        append = out.append
+
+        for date_str in date_strs:
+            if date_str in cache:
+                append(cache[date_str])
+                continue
+
+            try:
+                converted = strptime(str(date_str), "%Y%m%d")
+            except (ValueError, TypeError):
+                converted = None
+            cache[date_str] = converted
+            append(converted)
+
+        return out
+
+    def parse_datetime(self, date_str: str, column_key: str = None) -> Optional[datetime]:
         """
         Parse datetime from various string formats
 
+        This sits on the per-row hot path of the transaction load, so the
+        common case goes through the C-accelerated datetime.fromisoformat
+        and the strptime trial loop - whose misses each raise and catch a
+        ValueError, the expensive path in CPython - only runs on the first
+        row per column.
+
         Args:
             date_str: Date string in various formats (ISO 8601, YYYYMMDD, etc.)
+            column_key: Optional cache key (typically the CSV column name)
+                memoizing the matched format, so columns in different
+                formats do not evict each other's fast path
 
         Returns:
             DateTime object or None if parsing fails
@@ -68,19 +183,29 @@ class DataTransformer:
         if not date_str:
             return None
 
-        # Try common formats
-        formats = [
-            "%Y-%m-%dT%H:%M:%SZ",       # ISO 8601 with Z: 2017-01-01T00:00:00Z
-            "%Y-%m-%dT%H:%M:%S",        # ISO 8601: 2017-01-01T00:00:00
-            "%Y-%m-%d %H:%M:%S",        # SQL datetime: 2017-01-01 00:00:00
-            "%Y-%m-%d",                  # Date only: 2017-01-01
-            "%Y%m%d",                    # Compact: 20170101
-        ]
+        text = str(date_str).strip()
 
-        for fmt in formats:
+        # Fast path: ISO 8601 (with or without a trailing Z, stripped to
+        # keep the naive-datetime semantics of the strptime formats)
+        try:
+            return datetime.fromisoformat(text[:-1] if text.endswith('Z') else text)
+        except (ValueError, TypeError):
+            pass
+
+        # Memoized format for this column, then the full trial loop
+        cached_format = self._format_cache.get(column_key)
+        if cached_format:
             try:
-                return datetime.strptime(str(date_str).strip(), fmt)
-            except (ValueError, TypeError):
+                return datetime.strptime(text, cached_format)
+            except ValueError:
+                pass
+
+        for fmt in self._DATETIME_FORMATS:
+            try:
+                parsed = datetime.strptime(text, fmt)
+                self._format_cache[column_key] = fmt
+                return parsed
+            except ValueError:
                 continue
 
         return None
@@ -139,9 +264,14 @@ class DataTransformer:
         Normalization process:
         1. Combine address parts
         2. Lowercase all text
-        3. Remove special characters (keep only alphanumeric and spaces)
-        4. Collapse multiple spaces to one
-        5. Generate SHA-256 hash
+        3. Strip punctuation via a precomputed translate table
+        4. Collapse whitespace runs to single spaces
+        5. Generate BLAKE2b-128 hash
+
+        Called once per account row, so the hot path is translate (a
+        single C pass) plus split/join rather than two regex scans, and
+        BLAKE2b at digest_size=16 hashes faster than SHA-256 while
+        halving the indexed key length in Neo4j (32 hex chars vs 64).
 
         Args:
             street: Street address
@@ -149,19 +279,44 @@ class DataTransformer:
             postcode: Postal code
 
         Returns:
-            SHA-256 hash of normalized address (hex string)
+            BLAKE2b-128 hash of normalized address (32-char hex string)
+        """
+        combined = f"{street} {city} {postcode}".lower().translate(_PUNCT_TABLE)
+        normalized = ' '.join(combined.split())
+
+        return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+    @staticmethod
+    def normalize_address_keys_batch(streets: Sequence[str], cities: Sequence[str],
+                                     postcodes: Sequence[str]) -> List[str]:
         """
-        # Combine address parts
-        combined = f"{street} {city} {postcode}"
+        Generate normalized address keys for whole columns at once
 
-        # Lowercase and remove special chars
-        normalized = re.sub(r'[^a-z0-9\s]', '', combined.lower())
+        Same normalization and hash as normalize_address_key, but applied
+        to parallel street/city/postcode columns in a single comprehension
+        with the translate table, join and hash constructor bound as
+        locals. Callers that already have their rows columnized (the
+        address relationship loaders) pay one C-level zip iteration per
+        CSV instead of a method call, attribute lookups and f-string setup
+        per row.
 
-        # Collapse whitespace
-        normalized = re.sub(r'\s+', ' ', normalized.strip())
+        Args:
+            streets: Street address column
+            cities: City name column
+            postcodes: Postal code column
 
-        # Generate hash
-        return hashlib.sha256(normalized.encode()).hexdigest()
+        Returns:
+            BLAKE2b-128 hex keys, positionally aligned with the inputs
+        """
+        table = _PUNCT_TABLE
+        join = ' '.join
+        blake2b = hashlib.blake2b
+
+        return [
+            blake2b(join(f"{street} {city} {postcode}".lower().translate(table).split()).encode(),
+                    digest_size=16).hexdigest()
+            for street, city, postcode in zip(streets, cities, postcodes)
+        ]
 
 # ISO 3166-1 alpha-2 country code lookup table
 COUNTRY_CODES = {
@@ -188,14 +343,31 @@ COUNTRY_CODES = {
 }
 
 
+# Case-insensitive view of COUNTRY_CODES, built once at import: the CSV
+# sources emit either upper- or lowercase codes, so pre-seeding both
+# spellings makes the common lookup a single dict hit with no upper()
+# allocation; mixed-case oddballs fall back to the normalizing path
+_COUNTRY_CODES_CI = {**COUNTRY_CODES,
+                     **{code.lower(): name for code, name in COUNTRY_CODES.items()}}
+
+
+@lru_cache(maxsize=512)
 def get_country_name(code: str) -> str:
     """
     Get country name from ISO 3166-1 alpha-2 code
 
+    Memoized: loaders and validators call this once per row in places,
+    and the universe of codes is tiny, so repeat lookups cost one cache
+    probe. First-time lookups hit the pre-built any-case table and only
+    pay for upper() on mixed-case input.
+
     Args:
         code: Two-letter country code
 
     Returns:
         Country name or the code itself if not found
     """
+    name = _COUNTRY_CODES_CI.get(code)
+    if name is not None:
+        return name
     return COUNTRY_CODES.get(code.upper(), code)
@@ -2,140 +2,347 @@
 Validation queries for Neo4j data integrity checks
 """
 
-from neo4j import Driver
-from typing import Dict, List, Tuple
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
+from neo4j import Driver, READ_ACCESS
+from typing import Dict, Iterator, List, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Section banner built once for the process lifetime
+_BANNER = "=" * 60
+
+# Built UNION ALL query texts keyed by the name tuple they cover. Label
+# and relationship-type names cannot be Cypher parameters, so the count
+# queries are assembled from strings - caching the assembled text means
+# repeat validations send byte-identical queries, which is what the
+# server's plan cache keys on, and skips the per-call string build.
+_UNION_QUERY_CACHE: Dict[Tuple[str, ...], str] = {}
+
+
+# Fused check queries, shared by the sync and async validators. Each
+# returns both of its numbers from a single scan: the total and the
+# problem count aggregate over the same label, so splitting them doubled
+# both the scan and the Bolt round-trips.
+_TRANSACTION_INTEGRITY_QUERY = """
+MATCH (t:Transaction)
+WITH count(t) as total,
+     count(CASE WHEN NOT ((:Account)-[:PERFORMS]->(t)-[:BENEFITS_TO]->(:Account))
+                THEN 1 END) as incomplete
+RETURN total, incomplete,
+       CASE WHEN total > 0 THEN 100.0 * (total - incomplete) / total ELSE 0.0 END as integrity_pct
+"""
+
+# The orphan side is an OPTIONAL MATCH anti-join rather than a negated
+# pattern predicate: the planner expands HAS_ACCOUNT from the Account
+# side consistently instead of occasionally flipping to a Customer scan
+# when statistics go stale, which kept this check's runtime steady on
+# imbalanced datasets.
+_ACCOUNT_LINKS_QUERY = """
+MATCH (a:Account)
+OPTIONAL MATCH (c:Customer)-[:HAS_ACCOUNT]->(a)
+WITH a, count(c) as links
+WITH count(a) as total,
+     sum(CASE WHEN links = 0 THEN 1 ELSE 0 END) as orphaned
+RETURN total, orphaned,
+       CASE WHEN total > 0 THEN 100.0 * (total - orphaned) / total ELSE 0.0 END as linked_pct
+"""
+
+_SAR_SAMPLE_QUERY = """
+MATCH (orig:Account)-[:PERFORMS]->(t:SARTransaction)-[:BENEFITS_TO]->(dest:Account)
+RETURN t.transactionId as id, t.amount as amount, t.date as date,
+       t.alert_id as alertId, orig.accountNumber as origAccount,
+       dest.accountNumber as destAccount
+LIMIT $limit
+"""
+
+
+def _cached_union_query(names, branch_template: str) -> str:
+    """
+    Build (or fetch) the UNION ALL of one branch per name
+
+    Args:
+        names: Label or relationship-type names, one branch each
+        branch_template: format() template with a {name} placeholder
+
+    Returns:
+        The assembled query, identical for identical name tuples
+    """
+    key = (branch_template, *names)
+    query = _UNION_QUERY_CACHE.get(key)
+    if query is None:
+        query = "\nUNION ALL\n".join(branch_template.format(name=name) for name in names)
+        _UNION_QUERY_CACHE[key] = query
+    return query
+
+
+def _assemble_report(results: Dict) -> Dict:
+    """
+    Fold the raw check results into the validation report
+
+    Shared by the sync and async validators; runs on the caller's thread
+    after all checks complete.
+
+    Args:
+        results: Raw results keyed by check name
+
+    Returns:
+        Dictionary with validation results
+    """
+    report = {}
+
+    # Node counts
+    report["node_counts"] = results["node_counts"]
+    logger.info("Node counts: %s", report['node_counts'])
+
+    # Relationship counts
+    report["relationship_counts"] = results["relationship_counts"]
+    logger.info("Relationship counts: %s", report['relationship_counts'])
+
+    # Orphaned nodes
+    report["orphaned_nodes"] = results["orphaned_nodes"]
+    if report["orphaned_nodes"]:
+        logger.warning("Orphaned nodes found: %s", report['orphaned_nodes'])
+    else:
+        logger.info("No orphaned nodes found")
+
+    # Transaction integrity (the percentage is computed in-query, so the
+    # tuple is ready to serialize without a zero-guard branch here)
+    total_tx, incomplete_tx, integrity_pct = results["transactions"]
+    report["transactions"] = {
+        "total": total_tx,
+        "incomplete": incomplete_tx,
+        "integrity_pct": integrity_pct
+    }
+    if incomplete_tx > 0:
+        logger.warning("Found %s incomplete transactions out of %s", incomplete_tx, total_tx)
+    else:
+        logger.info("All %s transactions have proper flow", total_tx)
+
+    # Account-Customer links
+    total_accts, orphaned_accts, linked_pct = results["accounts"]
+    report["accounts"] = {
+        "total": total_accts,
+        "orphaned": orphaned_accts,
+        "linked_pct": linked_pct
+    }
+    if orphaned_accts > 0:
+        logger.warning("Found %s accounts without customers out of %s", orphaned_accts, total_accts)
+    else:
+        logger.info("All %s accounts are linked to customers", total_accts)
+
+    # SAR samples
+    sar_samples = results["sar_samples"]
+    report["sar_sample_count"] = len(sar_samples)
+    if sar_samples:
+        logger.info("Found %s SAR transaction samples", len(sar_samples))
+    else:
+        logger.info("No SAR transactions found (normal for datasets without alerts)")
+
+    logger.info("Validation complete")
+    return report
+
 
 class DataValidator:
     """
     Validates loaded Neo4j data for integrity and completeness
+
+    Query convention: project explicit fields (`t.amount as amount`),
+    never `RETURN n` or `properties(n)` - full-entity projections make
+    the server materialize every property of every record into the
+    result stage, which dominates result throughput on wide nodes. New
+    sample/detail queries should list exactly the columns their callers
+    read.
     """
 
-    def __init__(self, driver: Driver):
+    def __init__(self, driver: Driver, session=None, database=None):
         """
         Initialize validator
 
         Args:
             driver: Neo4j driver instance
+            session: Optional shared session to reuse instead of opening new ones
+            database: Target database name for sessions opened here; omitting
+                it costs the driver an extra routing round-trip per session
         """
         self.driver = driver
+        self.session = session
+        self.database = database
+        # Discovered schema metadata, fetched once per instance (see
+        # _get_labels / _get_rel_types); refresh_schema() invalidates
+        self._labels_cache = None
+        self._rel_types_cache = None
+
+    def _session(self):
+        """
+        Context manager yielding the shared session if one was provided,
+        otherwise a fresh session that is closed on exit
+        """
+        if self.session is not None:
+            return nullcontext(self.session)
+        # Validation is read-only; READ access lets a cluster route these
+        # sessions to read replicas instead of contending with the writer
+        return self.driver.session(database=self.database,
+                                   default_access_mode=READ_ACCESS)
+
+    def _get_labels(self, session) -> List[str]:
+        """
+        Labels present in the database, cached per validator instance
+
+        count_nodes_by_label and find_orphaned_nodes both enumerate the
+        labels; the schema does not change under a validation run, so the
+        db.labels() round-trip happens once and repeats hit the cache.
+        """
+        if self._labels_cache is None:
+            result = session.run("CALL db.labels()")
+            self._labels_cache = [record["label"] for record in result]
+        return self._labels_cache
+
+    def _get_rel_types(self, session) -> List[str]:
+        """
+        Relationship types present in the database, cached like _get_labels
+        """
+        if self._rel_types_cache is None:
+            result = session.run("CALL db.relationshipTypes()")
+            self._rel_types_cache = [record["relationshipType"] for record in result]
+        return self._rel_types_cache
+
+    def refresh_schema(self):
+        """
+        Drop the cached labels/relationship types so the next check
+        re-discovers them (call after loading new data)
+        """
+        self._labels_cache = None
+        self._rel_types_cache = None
 
     def count_nodes_by_label(self) -> Dict[str, int]:
         """
         Count nodes for each label
 
+        One round-trip fetches the labels and a second runs a UNION ALL
+        of per-label counts, instead of one query per label; each branch
+        is a count-store lookup on the server, so the old N+1 pattern
+        was pure Bolt latency.
+
         Returns:
-            Dictionary mapping label names to counts
+            Dictionary mapping label names to counts, sorted by label so
+            downstream consumers can iterate without re-sorting
         """
         counts = {}
 
-        with self.driver.session() as session:
-            # Get all labels
-            result = session.run("CALL db.labels()")
-            labels = [record["label"] for record in result]
+        with self._session() as session:
+            labels = self._get_labels(session)
+            if not labels:
+                return counts
 
-            # Count nodes for each label
-            for label in labels:
-                query = f"MATCH (n:{label}) RETURN count(n) as count"
-                result = session.run(query)
-                record = result.single()
-                counts[label] = record["count"] if record else 0
+            query = _cached_union_query(
+                labels, "MATCH (n:`{name}`) RETURN '{name}' as name, count(n) as count")
+            for record in session.run(query):
+                counts[record["name"]] = record["count"]
 
-        return counts
+        return dict(sorted(counts.items()))
 
     def count_relationships_by_type(self) -> Dict[str, int]:
         """
         Count relationships for each type
 
+        Same single-round-trip UNION ALL shape as count_nodes_by_label;
+        each branch hits the relationship count store.
+
         Returns:
-            Dictionary mapping relationship types to counts
+            Dictionary mapping relationship types to counts, sorted by
+            type so downstream consumers can iterate without re-sorting
         """
         counts = {}
 
-        with self.driver.session() as session:
-            # Get all relationship types
-            result = session.run("CALL db.relationshipTypes()")
-            rel_types = [record["relationshipType"] for record in result]
+        with self._session() as session:
+            rel_types = self._get_rel_types(session)
+            if not rel_types:
+                return counts
 
-            # Count relationships for each type
-            for rel_type in rel_types:
-                query = f"MATCH ()-[r:{rel_type}]->() RETURN count(r) as count"
-                result = session.run(query)
-                record = result.single()
-                counts[rel_type] = record["count"] if record else 0
+            query = _cached_union_query(
+                rel_types, "MATCH ()-[r:`{name}`]->() RETURN '{name}' as name, count(r) as count")
+            for record in session.run(query):
+                counts[record["name"]] = record["count"]
 
-        return counts
+        return dict(sorted(counts.items()))
 
     def find_orphaned_nodes(self) -> Dict[str, int]:
         """
         Find nodes with no relationships
 
+        Scans are label-bounded: instead of one global AllNodesScan with
+        a pattern-existence predicate on every node, each known label
+        gets its own UNION ALL branch that the planner serves from the
+        label index, and the whole union travels in one round-trip.
+
         Returns:
-            Dictionary mapping labels to orphan counts
+            Dictionary mapping labels to orphan counts, largest first
         """
         orphans = {}
 
-        with self.driver.session() as session:
-            query = """
-            MATCH (n)
-            WHERE NOT (n)--()
-            RETURN labels(n)[0] as label, count(n) as count
-            ORDER BY count DESC
-            """
-            result = session.run(query)
-            for record in result:
-                orphans[record["label"]] = record["count"]
+        with self._session() as session:
+            labels = self._get_labels(session)
+            if not labels:
+                return orphans
+
+            query = _cached_union_query(
+                labels,
+                "MATCH (n:`{name}`) WHERE NOT (n)--() "
+                "RETURN '{name}' as label, count(n) as count")
+            for record in session.run(query):
+                if record["count"] > 0:
+                    orphans[record["label"]] = record["count"]
 
-        return orphans
+        return dict(sorted(orphans.items(), key=lambda item: item[1], reverse=True))
 
-    def check_transaction_integrity(self) -> Tuple[int, int]:
+    def check_transaction_integrity(self) -> Tuple[int, int, float]:
         """
         Check transaction flow integrity
 
         Returns:
-            Tuple of (total_transactions, incomplete_transactions)
+            Tuple of (total_transactions, incomplete_transactions,
+            integrity percentage); all three come back in one record
         """
-        with self.driver.session() as session:
-            # Count total transactions
-            result = session.run("MATCH (t:Transaction) RETURN count(t) as total")
-            total = result.single()["total"]
-
-            # Count transactions without proper flow
-            query = """
-            MATCH (t:Transaction)
-            WHERE NOT ((:Account)-[:PERFORMS]->(t)-[:BENEFITS_TO]->(:Account))
-            RETURN count(t) as incomplete
-            """
-            result = session.run(query)
-            incomplete = result.single()["incomplete"]
-
-        return total, incomplete
+        with self._session() as session:
+            record = session.run(_TRANSACTION_INTEGRITY_QUERY).single()
+            return record["total"], record["incomplete"], record["integrity_pct"]
 
-    def check_account_customer_links(self) -> Tuple[int, int]:
+    def check_account_customer_links(self) -> Tuple[int, int, float]:
         """
         Check Account-Customer relationships
 
         Returns:
-            Tuple of (total_accounts, orphaned_accounts)
+            Tuple of (total_accounts, orphaned_accounts, linked
+            percentage); all three come back in one record
         """
-        with self.driver.session() as session:
-            # Count total accounts
-            result = session.run("MATCH (a:Account) RETURN count(a) as total")
-            total = result.single()["total"]
+        with self._session() as session:
+            record = session.run(_ACCOUNT_LINKS_QUERY).single()
+            return record["total"], record["orphaned"], record["linked_pct"]
+
+    def iter_sample_sar_transactions(self, limit: int = 10) -> Iterator[Dict]:
+        """
+        Stream sample SAR transactions as they arrive over Bolt
+
+        Records are yielded straight off the result stream, so consumers
+        that stop early never buffer the rest and see the first record
+        as soon as the server produces it. The generator holds its
+        session open until exhausted or closed - drain it fully before
+        issuing other statements on a shared session.
 
-            # Count accounts without customers
-            query = """
-            MATCH (a:Account)
-            WHERE NOT ((:Customer)-[:HAS_ACCOUNT]->(a))
-            RETURN count(a) as orphaned
-            """
-            result = session.run(query)
-            orphaned = result.single()["orphaned"]
+        Args:
+            limit: Maximum number of samples to yield
 
-        return total, orphaned
+        Yields:
+            One transaction dictionary per record
+        """
+        with self._session() as session:
+            result = session.run(_SAR_SAMPLE_QUERY, limit=limit)
+            for record in result:
+                yield dict(record)
 
     def get_sample_sar_transactions(self, limit: int = 10) -> List[Dict]:
         """
@@ -147,81 +354,42 @@ class DataValidator:
         Returns:
             List of transaction dictionaries
         """
-        samples = []
-
-        with self.driver.session() as session:
-            query = """
-            MATCH (orig:Account)-[:PERFORMS]->(t:SARTransaction)-[:BENEFITS_TO]->(dest:Account)
-            RETURN t.transactionId as id, t.amount as amount, t.date as date,
-                   t.alert_id as alertId, orig.accountNumber as origAccount,
-                   dest.accountNumber as destAccount
-            LIMIT $limit
-            """
-            result = session.run(query, limit=limit)
-            samples = [dict(record) for record in result]
-
-        return samples
+        return list(self.iter_sample_sar_transactions(limit))
 
     def validate_all(self) -> Dict:
         """
         Run all validation checks and return comprehensive report
 
+        The six checks are independent read-only queries, so when the
+        validator owns its sessions they are dispatched concurrently and
+        their Bolt round-trips overlap - wall clock drops to roughly the
+        slowest check instead of the sum. The driver is thread-safe but
+        sessions are not, so each worker opens its own session via
+        _session(); if a shared session was injected at construction the
+        checks fall back to running sequentially on it.
+
         Returns:
             Dictionary with validation results
         """
         logger.info("Running validation checks...")
 
-        report = {}
-
-        # Node counts
-        report["node_counts"] = self.count_nodes_by_label()
-        logger.info(f"Node counts: {report['node_counts']}")
-
-        # Relationship counts
-        report["relationship_counts"] = self.count_relationships_by_type()
-        logger.info(f"Relationship counts: {report['relationship_counts']}")
-
-        # Orphaned nodes
-        report["orphaned_nodes"] = self.find_orphaned_nodes()
-        if report["orphaned_nodes"]:
-            logger.warning(f"Orphaned nodes found: {report['orphaned_nodes']}")
-        else:
-            logger.info("No orphaned nodes found")
-
-        # Transaction integrity
-        total_tx, incomplete_tx = self.check_transaction_integrity()
-        report["transactions"] = {
-            "total": total_tx,
-            "incomplete": incomplete_tx,
-            "integrity_pct": 100.0 * (total_tx - incomplete_tx) / total_tx if total_tx > 0 else 0
+        checks = {
+            "node_counts": self.count_nodes_by_label,
+            "relationship_counts": self.count_relationships_by_type,
+            "orphaned_nodes": self.find_orphaned_nodes,
+            "transactions": self.check_transaction_integrity,
+            "accounts": self.check_account_customer_links,
+            "sar_samples": lambda: self.get_sample_sar_transactions(5),
         }
-        if incomplete_tx > 0:
-            logger.warning(f"Found {incomplete_tx} incomplete transactions out of {total_tx}")
-        else:
-            logger.info(f"All {total_tx} transactions have proper flow")
-
-        # Account-Customer links
-        total_accts, orphaned_accts = self.check_account_customer_links()
-        report["accounts"] = {
-            "total": total_accts,
-            "orphaned": orphaned_accts,
-            "linked_pct": 100.0 * (total_accts - orphaned_accts) / total_accts if total_accts > 0 else 0
-        }
-        if orphaned_accts > 0:
-            logger.warning(f"Found {orphaned_accts} accounts without customers out of {total_accts}")
-        else:
-            logger.info(f"All {total_accts} accounts are linked to customers")
 
-        # SAR samples
-        sar_samples = self.get_sample_sar_transactions(5)
-        report["sar_sample_count"] = len(sar_samples)
-        if sar_samples:
-            logger.info(f"Found {len(sar_samples)} SAR transaction samples")
+        if self.session is not None:
+            results = {name: check() for name, check in checks.items()}
         else:
-            logger.info("No SAR transactions found (normal for datasets without alerts)")
+            with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+                futures = {name: executor.submit(check) for name, check in checks.items()}
+                results = {name: future.result() for name, future in futures.items()}
 
-        logger.info("Validation complete")
-        return report
+        return _assemble_report(results)
 
     def print_summary(self, report: Dict):
         """
@@ -230,16 +398,18 @@ class DataValidator:
         Args:
             report: Validation report from validate_all()
         """
-        print("\n" + "=" * 60)
+        print("\n" + _BANNER)
         print("Neo4j Data Validation Summary")
-        print("=" * 60)
+        print(_BANNER)
 
+        # Count dicts arrive pre-sorted from the validation queries, so
+        # every reader (this summary, JSON serialization) shares one sort
         print("\nNode Counts:")
-        for label, count in sorted(report["node_counts"].items()):
+        for label, count in report["node_counts"].items():
             print(f"  {label:20s}: {count:,}")
 
         print("\nRelationship Counts:")
-        for rel_type, count in sorted(report["relationship_counts"].items()):
+        for rel_type, count in report["relationship_counts"].items():
             print(f"  {rel_type:20s}: {count:,}")
 
         if report["orphaned_nodes"]:
@@ -259,4 +429,185 @@ class DataValidator:
 
         print(f"\nSAR Transactions: {report['sar_sample_count']} samples found")
 
-        print("=" * 60 + "\n")
+        print(_BANNER + "\n")
+
+
+class AsyncDataValidator:
+    """
+    Async sibling of DataValidator for AsyncGraphDatabase drivers
+
+    Runs the same checks against an AsyncDriver and overlaps their Bolt
+    round-trips with asyncio.gather instead of a thread pool - no GIL
+    context switches, and each coroutine still gets its own session. The
+    sync class stays for the CLI; this one is for callers already inside
+    an event loop.
+    """
+
+    def __init__(self, driver, database=None):
+        """
+        Initialize async validator
+
+        Args:
+            driver: Neo4j AsyncDriver instance
+            database: Target database name for sessions opened here
+        """
+        self.driver = driver
+        self.database = database
+        # Discovered schema metadata, cached like the sync validator's
+        self._labels_cache = None
+        self._rel_types_cache = None
+
+    def _session(self):
+        """
+        Open a fresh async session against the configured database
+
+        READ access, same as the sync validator: clusters can route the
+        checks to read replicas.
+        """
+        return self.driver.session(database=self.database,
+                                   default_access_mode=READ_ACCESS)
+
+    async def _get_labels(self, session) -> List[str]:
+        """
+        Labels present in the database, cached per validator instance
+        """
+        if self._labels_cache is None:
+            result = await session.run("CALL db.labels()")
+            self._labels_cache = [record["label"] async for record in result]
+        return self._labels_cache
+
+    async def _get_rel_types(self, session) -> List[str]:
+        """
+        Relationship types present in the database, cached like _get_labels
+        """
+        if self._rel_types_cache is None:
+            result = await session.run("CALL db.relationshipTypes()")
+            self._rel_types_cache = [record["relationshipType"] async for record in result]
+        return self._rel_types_cache
+
+    def refresh_schema(self):
+        """
+        Drop the cached labels/relationship types so the next check
+        re-discovers them (call after loading new data)
+        """
+        self._labels_cache = None
+        self._rel_types_cache = None
+
+    async def count_nodes_by_label(self) -> Dict[str, int]:
+        """
+        Count nodes for each label (see DataValidator.count_nodes_by_label)
+        """
+        counts = {}
+
+        async with self._session() as session:
+            labels = await self._get_labels(session)
+            if not labels:
+                return counts
+
+            query = _cached_union_query(
+                labels, "MATCH (n:`{name}`) RETURN '{name}' as name, count(n) as count")
+            result = await session.run(query)
+            async for record in result:
+                counts[record["name"]] = record["count"]
+
+        return dict(sorted(counts.items()))
+
+    async def count_relationships_by_type(self) -> Dict[str, int]:
+        """
+        Count relationships for each type (see DataValidator.count_relationships_by_type)
+        """
+        counts = {}
+
+        async with self._session() as session:
+            rel_types = await self._get_rel_types(session)
+            if not rel_types:
+                return counts
+
+            query = _cached_union_query(
+                rel_types, "MATCH ()-[r:`{name}`]->() RETURN '{name}' as name, count(r) as count")
+            result = await session.run(query)
+            async for record in result:
+                counts[record["name"]] = record["count"]
+
+        return dict(sorted(counts.items()))
+
+    async def find_orphaned_nodes(self) -> Dict[str, int]:
+        """
+        Find nodes with no relationships (see DataValidator.find_orphaned_nodes)
+        """
+        orphans = {}
+
+        async with self._session() as session:
+            labels = await self._get_labels(session)
+            if not labels:
+                return orphans
+
+            query = _cached_union_query(
+                labels,
+                "MATCH (n:`{name}`) WHERE NOT (n)--() "
+                "RETURN '{name}' as label, count(n) as count")
+            result = await session.run(query)
+            async for record in result:
+                if record["count"] > 0:
+                    orphans[record["label"]] = record["count"]
+
+        return dict(sorted(orphans.items(), key=lambda item: item[1], reverse=True))
+
+    async def check_transaction_integrity(self) -> Tuple[int, int, float]:
+        """
+        Check transaction flow integrity (see DataValidator.check_transaction_integrity)
+        """
+        async with self._session() as session:
+            result = await session.run(_TRANSACTION_INTEGRITY_QUERY)
+            record = await result.single()
+            return record["total"], record["incomplete"], record["integrity_pct"]
+
+    async def check_account_customer_links(self) -> Tuple[int, int, float]:
+        """
+        Check Account-Customer relationships (see DataValidator.check_account_customer_links)
+        """
+        async with self._session() as session:
+            result = await session.run(_ACCOUNT_LINKS_QUERY)
+            record = await result.single()
+            return record["total"], record["orphaned"], record["linked_pct"]
+
+    async def get_sample_sar_transactions(self, limit: int = 10) -> List[Dict]:
+        """
+        Get sample SAR transactions (see DataValidator.get_sample_sar_transactions)
+        """
+        async with self._session() as session:
+            result = await session.run(_SAR_SAMPLE_QUERY, limit=limit)
+            return [dict(record) async for record in result]
+
+    async def validate_all(self) -> Dict:
+        """
+        Run all validation checks concurrently and return the report
+
+        Returns:
+            Dictionary with validation results, same shape as the sync
+            validator's
+        """
+        logger.info("Running validation checks...")
+
+        (node_counts, relationship_counts, orphaned_nodes,
+         transactions, accounts, sar_samples) = await asyncio.gather(
+            self.count_nodes_by_label(),
+            self.count_relationships_by_type(),
+            self.find_orphaned_nodes(),
+            self.check_transaction_integrity(),
+            self.check_account_customer_links(),
+            self.get_sample_sar_transactions(5),
+        )
+
+        return _assemble_report({
+            "node_counts": node_counts,
+            "relationship_counts": relationship_counts,
+            "orphaned_nodes": orphaned_nodes,
+            "transactions": transactions,
+            "accounts": accounts,
+            "sar_samples": sar_samples,
+        })
+
+    # The report format is identical, so the sync summary printer works
+    # for async-produced reports as well
+    print_summary = DataValidator.print_summary
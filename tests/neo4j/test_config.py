@@ -4,8 +4,10 @@ Unit tests for Neo4j loader configuration
 
 import unittest
 import tempfile
+import io
 import json
 import os
+import shutil
 import sys
 from datetime import datetime
 
@@ -14,63 +16,89 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../scripts/neo4j'
 
 from config import LoaderConfig
 
+# Fixture contents shared by both test cases; written to disk once per
+# class rather than once per test
+_TEST_CONF = {
+    "general": {
+        "simulation_name": "test_sim",
+        "base_date": "2020-01-01"
+    },
+    "output": {
+        "directory": "test_outputs",
+        "accounts": "accounts.csv",
+        "transactions": "tx.csv"
+    }
+}
+
+_TEST_PROPERTIES = (
+    "[neo4j]\n"
+    "neo4j.uri=bolt://testhost:7687\n"
+    "neo4j.user=testuser\n"
+    "neo4j.password=testpass\n"
+    "neo4j.database=testdb\n"
+    "neo4j.batch_size=5000\n"
+    "neo4j.primary_bank=testbank\n"
+    "neo4j.default_currency=EUR\n"
+    "neo4j.create_constraints=false\n"
+    "neo4j.create_indexes=false\n"
+)
+
+
+def _write_fixtures(temp_dir, conf):
+    """
+    Write conf.json and neo4j.properties into temp_dir, returning their paths
+    """
+    conf_json_path = os.path.join(temp_dir, 'conf.json')
+    neo4j_props_path = os.path.join(temp_dir, 'neo4j.properties')
+
+    with open(conf_json_path, 'w') as f:
+        json.dump(conf, f)
+    with open(neo4j_props_path, 'w') as f:
+        f.write(_TEST_PROPERTIES)
+
+    return conf_json_path, neo4j_props_path
+
 
 class TestLoaderConfig(unittest.TestCase):
     """
     Test suite for LoaderConfig class
+
+    The fixture files are written once in setUpClass: these tests never
+    mutate them, and LoaderConfig's mtime-keyed parse cache means each
+    construction after the first is a dict lookup plus a deep copy, so
+    the suite stops paying a JSON+INI parse per test. Tests that rewrite
+    conf.json live in TestLoaderConfigFileVariants below.
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
-        Set up test fixtures with temporary files
+        Write the shared fixture files once for the whole class
         """
-        # Create temporary conf.json
-        self.temp_dir = tempfile.mkdtemp()
-        self.conf_json_path = os.path.join(self.temp_dir, 'conf.json')
-        self.neo4j_props_path = os.path.join(self.temp_dir, 'neo4j.properties')
-
-        # Create test conf.json
-        self.test_conf = {
-            "general": {
-                "simulation_name": "test_sim",
-                "base_date": "2020-01-01"
-            },
-            "output": {
-                "directory": "test_outputs",
-                "accounts": "accounts.csv",
-                "transactions": "tx.csv"
-            }
-        }
-
-        with open(self.conf_json_path, 'w') as f:
-            json.dump(self.test_conf, f)
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.conf_json_path, cls.neo4j_props_path = _write_fixtures(cls.temp_dir, _TEST_CONF)
 
-        # Create test neo4j.properties
-        with open(self.neo4j_props_path, 'w') as f:
-            f.write("[neo4j]\n")
-            f.write("neo4j.uri=bolt://testhost:7687\n")
-            f.write("neo4j.user=testuser\n")
-            f.write("neo4j.password=testpass\n")
-            f.write("neo4j.database=testdb\n")
-            f.write("neo4j.batch_size=5000\n")
-            f.write("neo4j.primary_bank=testbank\n")
-            f.write("neo4j.default_currency=EUR\n")
-            f.write("neo4j.create_constraints=false\n")
-            f.write("neo4j.create_indexes=false\n")
+    def _make_config(self, **overrides):
+        """
+        Build a LoaderConfig from in-memory file objects, skipping disk
+        entirely; only the cache tests below need the real fixture files
+        """
+        return LoaderConfig(io.StringIO(json.dumps(_TEST_CONF)),
+                            io.StringIO(_TEST_PROPERTIES), **overrides)
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """
-        Clean up temporary files
+        Clean up the shared temporary files
         """
-        import shutil
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        if os.path.exists(cls.temp_dir):
+            shutil.rmtree(cls.temp_dir)
 
     def test_load_amlsim_config(self):
         """
         Test loading AMLSim configuration
         """
-        config = LoaderConfig(self.conf_json_path, self.neo4j_props_path)
+        config = self._make_config()
 
         self.assertEqual(config.sim_name, "test_sim")
         self.assertEqual(config.base_date_str, "2020-01-01")
@@ -80,7 +108,7 @@ class TestLoaderConfig(unittest.TestCase):
         """
         Test loading Neo4j properties file
         """
-        config = LoaderConfig(self.conf_json_path, self.neo4j_props_path)
+        config = self._make_config()
 
         self.assertEqual(config.neo4j_uri, "bolt://testhost:7687")
         self.assertEqual(config.neo4j_user, "testuser")
@@ -91,42 +119,49 @@ class TestLoaderConfig(unittest.TestCase):
         """
         Test batch size from properties file
         """
-        config = LoaderConfig(self.conf_json_path, self.neo4j_props_path)
+        config = self._make_config()
         self.assertEqual(config.batch_size, 5000)
 
     def test_batch_size_override(self):
         """
         Test batch size override via constructor
         """
-        config = LoaderConfig(self.conf_json_path, self.neo4j_props_path, batch_size=15000)
+        config = self._make_config(batch_size=15000)
         self.assertEqual(config.batch_size, 15000)
 
+    def test_batch_size_clamped(self):
+        """
+        Test batch size is clamped to the 100,000 upper bound
+        """
+        config = self._make_config(batch_size=500000)
+        self.assertEqual(config.batch_size, 100000)
+
     def test_primary_bank_configuration(self):
         """
         Test primary bank from properties file
         """
-        config = LoaderConfig(self.conf_json_path, self.neo4j_props_path)
+        config = self._make_config()
         self.assertEqual(config.primary_bank, "testbank")
 
     def test_primary_bank_override(self):
         """
         Test primary bank override via constructor
         """
-        config = LoaderConfig(self.conf_json_path, self.neo4j_props_path, primary_bank="overridebank")
+        config = self._make_config(primary_bank="overridebank")
         self.assertEqual(config.primary_bank, "overridebank")
 
     def test_default_currency(self):
         """
         Test default currency configuration
         """
-        config = LoaderConfig(self.conf_json_path, self.neo4j_props_path)
+        config = self._make_config()
         self.assertEqual(config.default_currency, "EUR")
 
     def test_schema_flags(self):
         """
         Test schema creation flags
         """
-        config = LoaderConfig(self.conf_json_path, self.neo4j_props_path)
+        config = self._make_config()
         self.assertFalse(config.create_constraints)
         self.assertFalse(config.create_indexes)
 
@@ -134,14 +169,14 @@ class TestLoaderConfig(unittest.TestCase):
         """
         Test output directory path construction
         """
-        config = LoaderConfig(self.conf_json_path, self.neo4j_props_path)
+        config = self._make_config()
         self.assertEqual(config.output_dir, "test_outputs/test_sim")
 
     def test_get_csv_path(self):
         """
         Test CSV path resolution
         """
-        config = LoaderConfig(self.conf_json_path, self.neo4j_props_path)
+        config = self._make_config()
 
         accounts_path = config.get_csv_path('accounts')
         self.assertEqual(accounts_path, "test_outputs/test_sim/accounts.csv")
@@ -153,18 +188,85 @@ class TestLoaderConfig(unittest.TestCase):
         """
         Test csv_exists returns False for non-existent files
         """
-        config = LoaderConfig(self.conf_json_path, self.neo4j_props_path)
+        config = self._make_config()
         self.assertFalse(config.csv_exists('accounts'))
         self.assertFalse(config.csv_exists('transactions'))
 
+    def test_missing_properties_file_uses_defaults(self):
+        """
+        Test that missing properties file falls back to defaults
+        """
+        config = LoaderConfig(io.StringIO(json.dumps(_TEST_CONF)), "nonexistent.properties")
+
+        # Should use default values
+        self.assertEqual(config.neo4j_uri, "bolt://localhost:7687")
+        self.assertEqual(config.neo4j_user, "neo4j")
+        self.assertEqual(config.neo4j_password, "password")
+        self.assertEqual(config.neo4j_database, "neo4j")
+        self.assertEqual(config.batch_size, 20000)
+        self.assertEqual(config.primary_bank, "bank")
+        self.assertEqual(config.default_currency, "USD")
+        self.assertTrue(config.create_constraints)
+        self.assertTrue(config.create_indexes)
+
+    def test_config_cache_returns_independent_copies(self):
+        """
+        Test that cached config parses are not shared between instances
+        """
+        config1 = LoaderConfig(self.conf_json_path, self.neo4j_props_path)
+        config2 = LoaderConfig(self.conf_json_path, self.neo4j_props_path)
+
+        # Mutating one instance's parsed config must not leak into another
+        config1.amlsim_conf['general']['simulation_name'] = "mutated"
+        self.assertEqual(config2.amlsim_conf['general']['simulation_name'], "test_sim")
+
+    def test_clear_cache(self):
+        """
+        Test that clear_cache forces a re-parse from disk
+        """
+        config = LoaderConfig(self.conf_json_path, self.neo4j_props_path)
+        self.assertEqual(config.sim_name, "test_sim")
+
+        LoaderConfig.clear_cache()
+
+        config = LoaderConfig(self.conf_json_path, self.neo4j_props_path)
+        self.assertEqual(config.sim_name, "test_sim")
+
+
+class TestLoaderConfigFileVariants(unittest.TestCase):
+    """
+    Tests that rewrite conf.json, so each gets its own fixture files
+    """
+
+    def setUp(self):
+        """
+        Set up per-test fixture files safe to mutate
+        """
+        self.temp_dir = tempfile.mkdtemp()
+        self.test_conf = json.loads(json.dumps(_TEST_CONF))
+        self.conf_json_path, self.neo4j_props_path = _write_fixtures(self.temp_dir, self.test_conf)
+
+    def tearDown(self):
+        """
+        Clean up temporary files
+        """
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def _rewrite_conf(self):
+        """
+        Rewrite conf.json with the test's mutated configuration
+        """
+        with open(self.conf_json_path, 'w') as f:
+            json.dump(self.test_conf, f)
+
     def test_csv_exists_true(self):
         """
         Test csv_exists returns True for existing files
         """
         # Update conf.json to use temp_dir for output
         self.test_conf['output']['directory'] = self.temp_dir + "/test_outputs"
-        with open(self.conf_json_path, 'w') as f:
-            json.dump(self.test_conf, f)
+        self._rewrite_conf()
 
         # Create the output directory and file
         output_dir = os.path.join(self.temp_dir, "test_outputs/test_sim")
@@ -178,30 +280,12 @@ class TestLoaderConfig(unittest.TestCase):
         config = LoaderConfig(self.conf_json_path, self.neo4j_props_path)
         self.assertTrue(config.csv_exists('accounts'))
 
-    def test_missing_properties_file_uses_defaults(self):
-        """
-        Test that missing properties file falls back to defaults
-        """
-        config = LoaderConfig(self.conf_json_path, "nonexistent.properties")
-
-        # Should use default values
-        self.assertEqual(config.neo4j_uri, "bolt://localhost:7687")
-        self.assertEqual(config.neo4j_user, "neo4j")
-        self.assertEqual(config.neo4j_password, "password")
-        self.assertEqual(config.neo4j_database, "neo4j")
-        self.assertEqual(config.batch_size, 10000)
-        self.assertEqual(config.primary_bank, "bank")
-        self.assertEqual(config.default_currency, "USD")
-        self.assertTrue(config.create_constraints)
-        self.assertTrue(config.create_indexes)
-
     def test_empty_simulation_name(self):
         """
         Test handling of empty simulation name
         """
         self.test_conf['general']['simulation_name'] = ""
-        with open(self.conf_json_path, 'w') as f:
-            json.dump(self.test_conf, f)
+        self._rewrite_conf()
 
         config = LoaderConfig(self.conf_json_path, self.neo4j_props_path)
         self.assertEqual(config.sim_name, "")
@@ -211,8 +295,7 @@ class TestLoaderConfig(unittest.TestCase):
         Test missing general section uses defaults
         """
         del self.test_conf['general']
-        with open(self.conf_json_path, 'w') as f:
-            json.dump(self.test_conf, f)
+        self._rewrite_conf()
 
         config = LoaderConfig(self.conf_json_path, self.neo4j_props_path)
         self.assertEqual(config.sim_name, "sample")
@@ -223,8 +306,7 @@ class TestLoaderConfig(unittest.TestCase):
         Test missing output section uses defaults
         """
         del self.test_conf['output']
-        with open(self.conf_json_path, 'w') as f:
-            json.dump(self.test_conf, f)
+        self._rewrite_conf()
 
         config = LoaderConfig(self.conf_json_path, self.neo4j_props_path)
         self.assertEqual(config.output_dir, "outputs/test_sim")
@@ -63,6 +63,20 @@ class TestDataTransformer(unittest.TestCase):
         result = self.transformer.days_to_datetime("invalid")
         self.assertIsNone(result)
 
+    def test_days_to_datetime_batch(self):
+        """
+        Test batch day conversion matches the scalar path
+        """
+        values = [0, 10, "365", 10, 1000000, 9999999, None, "invalid", 0]
+
+        batch = self.transformer.days_to_datetime_batch(values)
+        scalar = [self.transformer.days_to_datetime(value) for value in values]
+
+        self.assertEqual(batch, scalar)
+
+        # Empty column yields an empty result
+        self.assertEqual(self.transformer.days_to_datetime_batch([]), [])
+
     def test_yyyymmdd_to_datetime_valid(self):
         """
         Test conversion of YYYYMMDD strings to datetime
@@ -88,6 +102,20 @@ class TestDataTransformer(unittest.TestCase):
         result = self.transformer.yyyymmdd_to_datetime("2017-01-01")  # Wrong format
         self.assertIsNone(result)
 
+    def test_yyyymmdd_to_datetime_batch(self):
+        """
+        Test batch YYYYMMDD conversion matches the scalar path
+        """
+        values = ["20170101", "20171231", "20170101", "invalid", None, "2017-01-01"]
+
+        batch = self.transformer.yyyymmdd_to_datetime_batch(values)
+        scalar = [self.transformer.yyyymmdd_to_datetime(value) for value in values]
+
+        self.assertEqual(batch, scalar)
+
+        # Empty column yields an empty result
+        self.assertEqual(self.transformer.yyyymmdd_to_datetime_batch([]), [])
+
     def test_parse_boolean_from_string(self):
         """
         Test boolean parsing from strings
@@ -162,10 +190,28 @@ class TestDataTransformer(unittest.TestCase):
         hash4 = DataTransformer.normalize_address_key("456 Oak Ave", "New York", "10001")
         self.assertNotEqual(hash1, hash4)
 
-        # Hash should be SHA-256 hex (64 characters)
-        self.assertEqual(len(hash1), 64)
+        # Hash should be BLAKE2b-128 hex (32 characters)
+        self.assertEqual(len(hash1), 32)
         self.assertTrue(all(c in '0123456789abcdef' for c in hash1))
 
+    def test_normalize_address_keys_batch(self):
+        """
+        Test batch address normalization matches the per-row path
+        """
+        streets = ["123 Main St", "123 MAIN ST", "456 Oak Ave"]
+        cities = ["New York", "new york", "New York"]
+        postcodes = ["10001", "10001", "10001"]
+
+        batch = DataTransformer.normalize_address_keys_batch(streets, cities, postcodes)
+
+        self.assertEqual(batch, [
+            DataTransformer.normalize_address_key(s, c, p)
+            for s, c, p in zip(streets, cities, postcodes)
+        ])
+
+        # Batch over empty columns is an empty list
+        self.assertEqual(DataTransformer.normalize_address_keys_batch([], [], []), [])
+
 
 class TestCountryCodeLookup(unittest.TestCase):
     """